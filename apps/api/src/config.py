@@ -19,6 +19,12 @@ class Settings(BaseSettings):
 
     # Database (PlanetScale)
     database_url: str = ""
+    # Connection pool per process. Sync handlers run in FastAPI's threadpool,
+    # so concurrent requests beyond pool_size + max_overflow wait for a
+    # connection; Lambda serves one request at a time and needs few.
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_recycle_seconds: int = 1800
 
     # AWS Cognito
     cognito_user_pool_id: str = ""
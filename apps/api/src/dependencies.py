@@ -1,4 +1,5 @@
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -29,18 +30,24 @@ async def get_current_user(
 
 async def get_current_user_org(
     user: Annotated[dict, Depends(get_current_user)],
-) -> str:
-    """Get the current user's organization ID."""
+) -> UUID:
+    """Get the current user's organization ID, parsed once per request."""
     org_id = user.get("custom:org_id")
     if not org_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User not associated with an organization",
         )
-    return org_id
+    try:
+        return UUID(org_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid organization ID",
+        )
 
 
 # Type aliases for cleaner dependency injection
 CurrentUser = Annotated[dict, Depends(get_current_user)]
-CurrentOrgId = Annotated[str, Depends(get_current_user_org)]
+CurrentOrgId = Annotated[UUID, Depends(get_current_user_org)]
 DbSession = Annotated[Session, Depends(get_db)]
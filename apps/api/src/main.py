@@ -8,6 +8,7 @@ from fastapi.responses import JSONResponse
 from mangum import Mangum
 
 from src.config import get_settings
+from src.models.database import get_engine
 from src.routers import auth, changesets, connections, objects, organizations, sync
 
 settings = get_settings()
@@ -21,7 +22,10 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Startup
     yield
-    # Shutdown
+    # Shutdown: close pooled database connections
+    engine = get_engine()
+    if engine is not None:
+        engine.dispose()
 
 
 app = FastAPI(
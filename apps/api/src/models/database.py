@@ -13,6 +13,7 @@ from sqlalchemy import (
     String,
     Text,
     create_engine,
+    text,
 )
 from sqlalchemy.dialects.postgresql import INET, JSONB, UUID
 from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
@@ -33,8 +34,10 @@ def get_engine():
         _engine = create_engine(
             settings.database_url,
             pool_pre_ping=True,
-            pool_size=5,
-            max_overflow=10,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            # Replace connections before server-side idle timeouts drop them
+            pool_recycle=settings.db_pool_recycle_seconds,
             # PlanetScale connection settings
             connect_args={
                 "sslmode": "require",
@@ -177,7 +180,22 @@ class PlatformUser(Base):
 
     connection = relationship("Connection", back_populates="platform_users")
 
-    __table_args__ = (Index("idx_platform_users_connection", "connection_id"),)
+    __table_args__ = (
+        Index("idx_platform_users_connection", "connection_id"),
+        # Trigram indexes for the ILIKE substring search (requires pg_trgm)
+        Index(
+            "idx_platform_users_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_platform_users_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
 
 
 class PlatformRole(Base):
@@ -199,7 +217,22 @@ class PlatformRole(Base):
 
     connection = relationship("Connection", back_populates="platform_roles")
 
-    __table_args__ = (Index("idx_platform_roles_connection", "connection_id"),)
+    __table_args__ = (
+        Index("idx_platform_roles_connection", "connection_id"),
+        Index(
+            "idx_platform_roles_conn_name_system",
+            "connection_id",
+            "name",
+            postgresql_include=["is_system"],
+        ),
+        # Trigram index for the ILIKE substring search (requires pg_trgm)
+        Index(
+            "idx_platform_roles_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
 
 class RoleAssignment(Base):
@@ -217,6 +250,18 @@ class RoleAssignment(Base):
     platform_data = Column(JSONB, default={})
     synced_at = Column(DateTime(timezone=True), default=datetime.utcnow)
 
+    # Lookups by (connection_id, role_name, assignee_type) are served by the
+    # table's UNIQUE(connection_id, role_name, assignee_type, assignee_name)
+    __table_args__ = (
+        Index(
+            "idx_role_assignments_conn_assignee",
+            "connection_id",
+            "assignee_type",
+            "assignee_name",
+            postgresql_include=["role_name"],
+        ),
+    )
+
 
 class PlatformGrant(Base):
     __tablename__ = "platform_grants"
@@ -238,6 +283,27 @@ class PlatformGrant(Base):
     platform_data = Column(JSONB, default={})
     synced_at = Column(DateTime(timezone=True), default=datetime.utcnow)
 
+    __table_args__ = (
+        Index(
+            "idx_platform_grants_conn_grantee",
+            "connection_id",
+            "grantee_type",
+            "grantee_name",
+        ),
+        Index(
+            "idx_platform_grants_conn_object",
+            "connection_id",
+            "object_type",
+            "object_name",
+        ),
+        Index(
+            "idx_platform_grants_conn_imported",
+            "connection_id",
+            "object_database",
+            postgresql_where=text("privilege = 'IMPORTED PRIVILEGES'"),
+        ),
+    )
+
 
 # ============================================================================
 # CHANGE MANAGEMENT
@@ -267,7 +333,17 @@ class Changeset(Base):
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow)
 
-    changes = relationship("Change", back_populates="changeset")
+    changes = relationship(
+        "Change", back_populates="changeset", order_by="Change.execution_order"
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_changesets_org_pending",
+            "org_id",
+            postgresql_where=text("status IN ('draft', 'pending_review')"),
+        ),
+    )
 
 
 class Change(Base):
@@ -2,17 +2,19 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
 from src.dependencies import CurrentOrgId, CurrentUser, DbSession
 from src.models.database import Change, Changeset, Connection
 from src.models.schemas import ChangesetCreate, ChangesetResponse
-from src.services.sql_generator import generate_sql_for_change
+from src.routers.objects import forget_stats
+from src.services.sql_generator import generate_sql_for_changes
 
 router = APIRouter(prefix="/changesets")
 
 
 @router.get("", response_model=list[ChangesetResponse])
-async def list_changesets(
+def list_changesets(
     org_id: CurrentOrgId,
     db: DbSession,
     connection_id: UUID = Query(None),
@@ -21,7 +23,7 @@ async def list_changesets(
     offset: int = Query(0),
 ):
     """List changesets for the organization."""
-    query = select(Changeset).where(Changeset.org_id == UUID(org_id))
+    query = select(Changeset).where(Changeset.org_id == org_id)
 
     if connection_id:
         query = query.where(Changeset.connection_id == connection_id)
@@ -29,15 +31,20 @@ async def list_changesets(
     if status_filter:
         query = query.where(Changeset.status == status_filter)
 
+    # The response includes each changeset's changes; load them for the whole
+    # page in one extra query rather than one lazy load per changeset
     changesets = db.execute(
-        query.order_by(Changeset.created_at.desc()).limit(limit).offset(offset)
+        query.options(selectinload(Changeset.changes))
+        .order_by(Changeset.created_at.desc())
+        .limit(limit)
+        .offset(offset)
     ).scalars().all()
 
     return changesets
 
 
 @router.post("", response_model=ChangesetResponse, status_code=status.HTTP_201_CREATED)
-async def create_changeset(
+def create_changeset(
     changeset: ChangesetCreate,
     org_id: CurrentOrgId,
     user: CurrentUser,
@@ -48,7 +55,7 @@ async def create_changeset(
     connection = db.execute(
         select(Connection).where(
             Connection.id == changeset.connection_id,
-            Connection.org_id == UUID(org_id),
+            Connection.org_id == org_id,
         )
     ).scalar_one_or_none()
 
@@ -60,7 +67,7 @@ async def create_changeset(
 
     # Create changeset
     db_changeset = Changeset(
-        org_id=UUID(org_id),
+        org_id=org_id,
         connection_id=changeset.connection_id,
         title=changeset.title,
         description=changeset.description,
@@ -72,15 +79,8 @@ async def create_changeset(
     db.flush()
 
     # Create changes with generated SQL
-    for idx, change in enumerate(changeset.changes):
-        sql = generate_sql_for_change(
-            platform=connection.platform,
-            change_type=change.change_type,
-            object_type=change.object_type,
-            object_name=change.object_name,
-            details=change.details,
-        )
-
+    statements = generate_sql_for_changes(connection.platform, changeset.changes)
+    for idx, (change, sql) in enumerate(zip(changeset.changes, statements)):
         db_change = Change(
             changeset_id=db_changeset.id,
             change_type=change.change_type,
@@ -94,12 +94,13 @@ async def create_changeset(
 
     db.commit()
     db.refresh(db_changeset)
+    forget_stats(org_id)
 
     return db_changeset
 
 
 @router.get("/{changeset_id}", response_model=ChangesetResponse)
-async def get_changeset(
+def get_changeset(
     changeset_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
@@ -108,7 +109,7 @@ async def get_changeset(
     changeset = db.execute(
         select(Changeset).where(
             Changeset.id == changeset_id,
-            Changeset.org_id == UUID(org_id),
+            Changeset.org_id == org_id,
         )
     ).scalar_one_or_none()
 
@@ -131,7 +132,7 @@ async def get_changeset(
 
 
 @router.post("/{changeset_id}/approve")
-async def approve_changeset(
+def approve_changeset(
     changeset_id: UUID,
     org_id: CurrentOrgId,
     user: CurrentUser,
@@ -141,7 +142,7 @@ async def approve_changeset(
     changeset = db.execute(
         select(Changeset).where(
             Changeset.id == changeset_id,
-            Changeset.org_id == UUID(org_id),
+            Changeset.org_id == org_id,
         )
     ).scalar_one_or_none()
 
@@ -164,12 +165,13 @@ async def approve_changeset(
     changeset.reviewed_at = datetime.utcnow()
 
     db.commit()
+    forget_stats(org_id)
 
     return {"status": "approved"}
 
 
 @router.post("/{changeset_id}/mark-applied")
-async def mark_changeset_applied(
+def mark_changeset_applied(
     changeset_id: UUID,
     org_id: CurrentOrgId,
     user: CurrentUser,
@@ -180,7 +182,7 @@ async def mark_changeset_applied(
     changeset = db.execute(
         select(Changeset).where(
             Changeset.id == changeset_id,
-            Changeset.org_id == UUID(org_id),
+            Changeset.org_id == org_id,
         )
     ).scalar_one_or_none()
 
@@ -198,12 +200,13 @@ async def mark_changeset_applied(
     changeset.applied_via = applied_via
 
     db.commit()
+    forget_stats(org_id)
 
     return {"status": "applied"}
 
 
 @router.post("/{changeset_id}/request-review")
-async def request_changeset_review(
+def request_changeset_review(
     changeset_id: UUID,
     org_id: CurrentOrgId,
     user: CurrentUser,
@@ -213,7 +216,7 @@ async def request_changeset_review(
     changeset = db.execute(
         select(Changeset).where(
             Changeset.id == changeset_id,
-            Changeset.org_id == UUID(org_id),
+            Changeset.org_id == org_id,
         )
     ).scalar_one_or_none()
 
@@ -236,7 +239,7 @@ async def request_changeset_review(
 
 
 @router.delete("/{changeset_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_changeset(
+def delete_changeset(
     changeset_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
@@ -245,7 +248,7 @@ async def delete_changeset(
     changeset = db.execute(
         select(Changeset).where(
             Changeset.id == changeset_id,
-            Changeset.org_id == UUID(org_id),
+            Changeset.org_id == org_id,
         )
     ).scalar_one_or_none()
 
@@ -269,5 +272,6 @@ async def delete_changeset(
     db.execute(delete(Change).where(Change.changeset_id == changeset_id))
     db.delete(changeset)
     db.commit()
+    forget_stats(org_id)
 
     return None
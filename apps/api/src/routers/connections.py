@@ -2,13 +2,10 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-import boto3
 from botocore.exceptions import ClientError
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
 from fastapi import APIRouter, BackgroundTasks, HTTPException, status
 from pydantic import BaseModel
-from sqlalchemy import delete, func, select
+from sqlalchemy import func, select
 
 from src.config import get_settings
 from src.dependencies import CurrentOrgId, CurrentUser, DbSession
@@ -16,12 +13,20 @@ from src.models.database import (
     Connection,
     PlatformGrant,
     PlatformRole,
-    PlatformUser,
     RoleAssignment,
     SyncRun,
 )
 from src.models.schemas import ConnectionCreate, ConnectionResponse, ConnectionUpdate
-from src.services.sync.snowflake import SnowflakeConnector
+from src.routers.objects import forget_connection_access, forget_stats
+from src.services.aws import get_parameter, get_ssm_client
+from src.services.sync.service import (
+    delete_grants,
+    insert_grants,
+    upsert_role_assignments,
+    upsert_roles,
+    upsert_users,
+)
+from src.services.sync.snowflake import SnowflakeConnector, load_private_key
 
 router = APIRouter(prefix="/connections")
 settings = get_settings()
@@ -49,22 +54,7 @@ class ConnectionCreateWithKey(ConnectionCreate):
 def parse_private_key(private_key_pem: str) -> bytes:
     """Parse a PEM-encoded private key and return the key bytes for Snowflake."""
     try:
-        # Clean up the key - normalize line endings
-        key_text = private_key_pem.strip()
-
-        # Load the private key
-        private_key = serialization.load_pem_private_key(
-            key_text.encode('utf-8'),
-            password=None,
-            backend=default_backend()
-        )
-
-        # Return the private key bytes in DER format (what Snowflake expects)
-        return private_key.private_bytes(
-            encoding=serialization.Encoding.DER,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption()
-        )
+        return load_private_key(private_key_pem)
     except Exception as e:
         raise ValueError(f"Invalid private key format: {str(e)}")
 
@@ -72,7 +62,7 @@ def parse_private_key(private_key_pem: str) -> bytes:
 def store_credentials_param_store(param_path: str, private_key_pem: str) -> None:
     """Store credentials in AWS Parameter Store (production only)."""
     try:
-        ssm = boto3.client('ssm', region_name=settings.aws_region)
+        ssm = get_ssm_client()
         ssm.put_parameter(
             Name=param_path,
             Value=private_key_pem,
@@ -90,9 +80,7 @@ def store_credentials_param_store(param_path: str, private_key_pem: str) -> None
 def get_credentials_from_param_store(param_path: str) -> str | None:
     """Retrieve credentials from AWS Parameter Store (production only)."""
     try:
-        ssm = boto3.client('ssm', region_name=settings.aws_region)
-        response = ssm.get_parameter(Name=param_path, WithDecryption=True)
-        return response['Parameter']['Value']
+        return get_parameter(param_path)
     except ClientError:
         return None
 
@@ -105,13 +93,13 @@ def get_connection_credentials(connection: Connection) -> str | None:
 
 
 @router.get("", response_model=list[ConnectionResponse])
-async def list_connections(
+def list_connections(
     org_id: CurrentOrgId,
     db: DbSession,
 ):
     """List all connections for the current organization."""
     connections = db.execute(
-        select(Connection).where(Connection.org_id == UUID(org_id))
+        select(Connection).where(Connection.org_id == org_id)
     ).scalars().all()
 
     return connections
@@ -162,7 +150,7 @@ async def test_connection(
 
 
 @router.post("", response_model=ConnectionResponse, status_code=status.HTTP_201_CREATED)
-async def create_connection(
+def create_connection(
     connection: ConnectionCreateWithKey,
     org_id: CurrentOrgId,
     user: CurrentUser,
@@ -188,7 +176,7 @@ async def create_connection(
 
     db_connection = Connection(
         id=connection_id,
-        org_id=UUID(org_id),
+        org_id=org_id,
         name=connection.name,
         platform=connection.platform,
         connection_config=connection.connection_config,
@@ -201,12 +189,13 @@ async def create_connection(
     db.add(db_connection)
     db.commit()
     db.refresh(db_connection)
+    forget_stats(org_id)
 
     return db_connection
 
 
 @router.get("/{connection_id}", response_model=ConnectionResponse)
-async def get_connection(
+def get_connection(
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
@@ -215,7 +204,7 @@ async def get_connection(
     connection = db.execute(
         select(Connection).where(
             Connection.id == connection_id,
-            Connection.org_id == UUID(org_id),
+            Connection.org_id == org_id,
         )
     ).scalar_one_or_none()
 
@@ -229,7 +218,7 @@ async def get_connection(
 
 
 @router.patch("/{connection_id}", response_model=ConnectionResponse)
-async def update_connection(
+def update_connection(
     connection_id: UUID,
     updates: ConnectionUpdate,
     org_id: CurrentOrgId,
@@ -239,7 +228,7 @@ async def update_connection(
     connection = db.execute(
         select(Connection).where(
             Connection.id == connection_id,
-            Connection.org_id == UUID(org_id),
+            Connection.org_id == org_id,
         )
     ).scalar_one_or_none()
 
@@ -255,12 +244,13 @@ async def update_connection(
 
     db.commit()
     db.refresh(connection)
+    forget_connection_access(connection_id)
 
     return connection
 
 
 @router.delete("/{connection_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_connection(
+def delete_connection(
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
@@ -269,7 +259,7 @@ async def delete_connection(
     connection = db.execute(
         select(Connection).where(
             Connection.id == connection_id,
-            Connection.org_id == UUID(org_id),
+            Connection.org_id == org_id,
         )
     ).scalar_one_or_none()
 
@@ -281,6 +271,8 @@ async def delete_connection(
 
     db.delete(connection)
     db.commit()
+    forget_connection_access(connection_id)
+    forget_stats(org_id)
 
 
 @router.post("/{connection_id}/test", response_model=ConnectionTestResponse)
@@ -293,7 +285,7 @@ async def test_existing_connection(
     connection = db.execute(
         select(Connection).where(
             Connection.id == connection_id,
-            Connection.org_id == UUID(org_id),
+            Connection.org_id == org_id,
         )
     ).scalar_one_or_none()
 
@@ -356,7 +348,7 @@ async def sync_connection(
     connection = db.execute(
         select(Connection).where(
             Connection.id == connection_id,
-            Connection.org_id == UUID(org_id),
+            Connection.org_id == org_id,
         )
     ).scalar_one_or_none()
 
@@ -393,35 +385,40 @@ async def sync_connection(
             user=connection.connection_config.get("username", "").strip(),
             private_key=private_key_bytes,
             warehouse=(connection.connection_config.get("warehouse") or "").strip() or None,
+            grants_source=connection.connection_config.get("grants_source", "show"),
         )
 
         # Sync users
         users = await connector.sync_users()
-        _upsert_users(db, connection_id, users)
+        upsert_users(db, connection_id, users)
         sync_run.users_synced = len(users)
 
         # Sync roles
         roles = await connector.sync_roles()
-        _upsert_roles(db, connection_id, roles)
+        upsert_roles(db, connection_id, roles)
         sync_run.roles_synced = len(roles)
 
         # Sync role assignments
         assignments = await connector.sync_role_assignments()
-        _upsert_role_assignments(db, connection_id, assignments)
+        upsert_role_assignments(db, connection_id, assignments)
 
-        # Sync grants (clear and replace)
-        grants = await connector.sync_grants()
-        _replace_grants(db, connection_id, grants)
-        sync_run.grants_synced = len(grants)
+        # Sync grants (clear and replace), a batch at a time as they arrive
+        delete_grants(db, connection_id)
+        grants_synced = 0
+        async for grants in connector.sync_grants():
+            insert_grants(db, connection_id, grants)
+            grants_synced += len(grants)
+        sync_run.grants_synced = grants_synced
 
         # Update role member and grant counts
         _update_role_counts(db, connection_id)
 
         # Update sync run and connection status
         sync_run.status = "completed"
-        sync_run.completed_at = datetime.utcnow()
+        completed_at = datetime.utcnow()
+        sync_run.completed_at = completed_at
 
-        connection.last_sync_at = datetime.utcnow()
+        connection.last_sync_at = completed_at
         connection.last_sync_status = "success"
         connection.last_sync_error = None
 
@@ -430,15 +427,20 @@ async def sync_connection(
 
         return SyncResponse(
             success=True,
-            message=f"Successfully synced {len(users)} users, {len(roles)} roles, {len(grants)} grants",
+            message=f"Successfully synced {len(users)} users, {len(roles)} roles, {grants_synced} grants",
             sync_run_id=str(sync_run.id),
             users_synced=len(users),
             roles_synced=len(roles),
-            grants_synced=len(grants),
+            grants_synced=grants_synced,
             role_assignments_synced=len(assignments),
         )
 
     except Exception as e:
+        # Discard the partial sync (including the grants delete), so the
+        # connection keeps its previous data, and clear a failed transaction
+        # before the failure is recorded
+        db.rollback()
+
         sync_run.status = "failed"
         sync_run.error_message = str(e)
         sync_run.completed_at = datetime.utcnow()
@@ -454,117 +456,6 @@ async def sync_connection(
         )
 
 
-def _upsert_users(db, connection_id: UUID, users: list):
-    """Upsert platform users."""
-    for user in users:
-        existing = db.execute(
-            select(PlatformUser).where(
-                PlatformUser.connection_id == connection_id,
-                PlatformUser.name == user.name,
-            )
-        ).scalar_one_or_none()
-
-        if existing:
-            existing.email = user.email
-            existing.display_name = user.display_name
-            existing.disabled = user.disabled
-            existing.platform_data = user.platform_data
-            existing.synced_at = datetime.utcnow()
-        else:
-            db.add(
-                PlatformUser(
-                    connection_id=connection_id,
-                    name=user.name,
-                    email=user.email,
-                    display_name=user.display_name,
-                    disabled=user.disabled,
-                    platform_data=user.platform_data,
-                )
-            )
-
-
-def _upsert_roles(db, connection_id: UUID, roles: list):
-    """Upsert platform roles."""
-    for role in roles:
-        existing = db.execute(
-            select(PlatformRole).where(
-                PlatformRole.connection_id == connection_id,
-                PlatformRole.name == role.name,
-            )
-        ).scalar_one_or_none()
-
-        if existing:
-            existing.description = role.description
-            existing.is_system = role.is_system
-            existing.platform_data = role.platform_data
-            existing.synced_at = datetime.utcnow()
-        else:
-            db.add(
-                PlatformRole(
-                    connection_id=connection_id,
-                    name=role.name,
-                    description=role.description,
-                    is_system=role.is_system,
-                    platform_data=role.platform_data,
-                )
-            )
-
-
-def _upsert_role_assignments(db, connection_id: UUID, assignments: list):
-    """Upsert role assignments."""
-    for assignment in assignments:
-        existing = db.execute(
-            select(RoleAssignment).where(
-                RoleAssignment.connection_id == connection_id,
-                RoleAssignment.role_name == assignment.role_name,
-                RoleAssignment.assignee_type == assignment.assignee_type,
-                RoleAssignment.assignee_name == assignment.assignee_name,
-            )
-        ).scalar_one_or_none()
-
-        if existing:
-            existing.assigned_by = assignment.assigned_by
-            existing.platform_data = assignment.platform_data
-            existing.synced_at = datetime.utcnow()
-        else:
-            db.add(
-                RoleAssignment(
-                    connection_id=connection_id,
-                    role_name=assignment.role_name,
-                    assignee_type=assignment.assignee_type,
-                    assignee_name=assignment.assignee_name,
-                    assigned_by=assignment.assigned_by,
-                    platform_data=assignment.platform_data,
-                )
-            )
-
-
-def _replace_grants(db, connection_id: UUID, grants: list):
-    """Replace all grants for a connection (delete old, insert new)."""
-    # Delete existing grants
-    db.execute(
-        delete(PlatformGrant).where(PlatformGrant.connection_id == connection_id)
-    )
-
-    # Insert new grants
-    for grant in grants:
-        db.add(
-            PlatformGrant(
-                connection_id=connection_id,
-                privilege=grant.privilege,
-                object_type=grant.object_type,
-                object_name=grant.object_name,
-                object_database=grant.object_database,
-                object_schema=grant.object_schema,
-                grantee_type=grant.grantee_type,
-                grantee_name=grant.grantee_name,
-                with_grant_option=grant.with_grant_option,
-                granted_by=grant.granted_by,
-                platform_data=grant.platform_data,
-            )
-        )
-
-
 def _update_role_counts(db, connection_id: UUID):
     """Update member_count and grant_count for all roles in a connection."""
     # Get all roles for this connection
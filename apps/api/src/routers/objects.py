@@ -1,9 +1,13 @@
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
+from typing import Iterator, NamedTuple
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
-from pydantic import BaseModel
-from sqlalchemy import func, select, distinct
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import and_, bindparam, distinct, func, literal, or_, select
 
 from src.dependencies import CurrentOrgId, DbSession
 from src.models.database import (
@@ -20,6 +24,7 @@ from src.models.schemas import (
     PlatformUserResponse,
     RoleAssignmentResponse,
 )
+from src.services.sql_generator import quote_identifier, quote_literal, quote_object_name
 
 
 class StatsResponse(BaseModel):
@@ -39,13 +44,17 @@ class RoleWithPath(BaseModel):
     is_system: bool | None = False
 
 
-class PrivilegeGrant(BaseModel):
+# One of these is built per grant of the user, so they are slotted dataclasses
+# rather than validated Pydantic models, like the access map models below.
+@dataclass(slots=True)
+class PrivilegeGrant:
     """A privilege with the role path that grants it."""
     privilege: str
     granted_via: str  # Full path like "ANALYST → DATA_VIEWER"
 
 
-class TableAccess(BaseModel):
+@dataclass(slots=True)
+class TableAccess:
     """Access to a table or view."""
     name: str
     privilege: str
@@ -180,74 +189,96 @@ def infer_role_type(
 
 router = APIRouter(prefix="/objects")
 
+# Snowflake-provided databases that are always shared/imported
+_IMPORTED_SENTINEL_DBS = frozenset(("SNOWFLAKE_SAMPLE_DATA", "SNOWFLAKE"))
+
+# Object types whose grants are shown as account-level privileges
+_ACCOUNT_LEVEL_OBJECT_TYPES = frozenset((
+    "WAREHOUSE", "ROLE", "USER", "INTEGRATION", "NOTIFICATION_INTEGRATION",
+    "SECURITY_INTEGRATION", "STORAGE_INTEGRATION", "RESOURCE_MONITOR",
+    "ACCOUNT", "NETWORK_POLICY", "SHARE",
+))
+
+
+# Dashboard counts for an org, built once and executed with an org_id parameter.
+# All counts come back in one round-trip, each as a scalar subquery.
+_org_connection_ids = select(Connection.id).where(
+    Connection.org_id == bindparam("org_id")
+)
+_STATS_QUERY = select(
+    select(func.count(Connection.id))
+    .where(Connection.org_id == bindparam("org_id"))
+    .scalar_subquery()
+    .label("connections"),
+    # Count users across all connections
+    select(func.count(PlatformUser.id))
+    .where(PlatformUser.connection_id.in_(_org_connection_ids))
+    .scalar_subquery()
+    .label("users"),
+    # Count roles across all connections
+    select(func.count(PlatformRole.id))
+    .where(PlatformRole.connection_id.in_(_org_connection_ids))
+    .scalar_subquery()
+    .label("roles"),
+    # Count grants across all connections
+    select(func.count(PlatformGrant.id))
+    .where(PlatformGrant.connection_id.in_(_org_connection_ids))
+    .scalar_subquery()
+    .label("grants"),
+    # Count pending changesets
+    select(func.count(Changeset.id))
+    .where(
+        Changeset.org_id == bindparam("org_id"),
+        Changeset.status.in_(["draft", "pending_review"]),
+    )
+    .scalar_subquery()
+    .label("pending_changesets"),
+)
+
+
+# Dashboard stats per org, org_id -> (expiry time, stats). The dashboard polls
+# this, so a few seconds of staleness is fine; changeset and connection writes
+# drop the entry right away via forget_stats().
+_STATS_TTL_SECONDS = 10.0
+_STATS_MAX_ENTRIES = 1024
+_org_stats: dict[UUID, tuple[float, StatsResponse]] = {}
+
+
+def forget_stats(org_id: UUID) -> None:
+    """Drop the cached dashboard stats of an org, e.g. after a changeset write."""
+    _org_stats.pop(org_id, None)
+
 
 @router.get("/stats", response_model=StatsResponse)
-async def get_stats(
+def get_stats(
     org_id: CurrentOrgId,
     db: DbSession,
 ):
     """Get dashboard stats for the organization."""
-    # Get connection IDs for this org
-    connection_ids = db.execute(
-        select(Connection.id).where(Connection.org_id == UUID(org_id))
-    ).scalars().all()
+    now = time.monotonic()
+    cached = _org_stats.get(org_id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
 
-    connections_count = len(connection_ids)
+    # Columns are labelled after the StatsResponse fields
+    stats = StatsResponse(**db.execute(_STATS_QUERY, {"org_id": org_id}).one()._mapping)
 
-    if not connection_ids:
-        return StatsResponse(
-            connections=0,
-            users=0,
-            roles=0,
-            grants=0,
-            pending_changesets=0,
-        )
+    if len(_org_stats) >= _STATS_MAX_ENTRIES:
+        _org_stats.clear()
+    _org_stats[org_id] = (now + _STATS_TTL_SECONDS, stats)
+    return stats
 
-    # Count users across all connections
-    users_count = db.execute(
-        select(func.count(PlatformUser.id)).where(
-            PlatformUser.connection_id.in_(connection_ids)
-        )
-    ).scalar() or 0
 
-    # Count roles across all connections
-    roles_count = db.execute(
-        select(func.count(PlatformRole.id)).where(
-            PlatformRole.connection_id.in_(connection_ids)
-        )
-    ).scalar() or 0
-
-    # Count grants across all connections
-    grants_count = db.execute(
-        select(func.count(PlatformGrant.id)).where(
-            PlatformGrant.connection_id.in_(connection_ids)
-        )
-    ).scalar() or 0
-
-    # Count pending changesets
-    pending_changesets = db.execute(
-        select(func.count(Changeset.id)).where(
-            Changeset.org_id == UUID(org_id),
-            Changeset.status.in_(["draft", "pending_review"]),
-        )
-    ).scalar() or 0
-
-    return StatsResponse(
-        connections=connections_count,
-        users=users_count,
-        roles=roles_count,
-        grants=grants_count,
-        pending_changesets=pending_changesets,
-    )
+_CONNECTION_LOOKUP = select(Connection).where(
+    Connection.id == bindparam("connection_id"),
+    Connection.org_id == bindparam("org_id"),
+)
 
 
-def verify_connection_access(db, connection_id: UUID, org_id: str) -> Connection:
+def verify_connection_access(db, connection_id: UUID, org_id: UUID) -> Connection:
     """Verify the connection exists and belongs to the org."""
     connection = db.execute(
-        select(Connection).where(
-            Connection.id == connection_id,
-            Connection.org_id == UUID(org_id),
-        )
+        _CONNECTION_LOOKUP, {"connection_id": connection_id, "org_id": org_id}
     ).scalar_one_or_none()
 
     if not connection:
@@ -259,17 +290,115 @@ def verify_connection_access(db, connection_id: UUID, org_id: str) -> Connection
     return connection
 
 
+# Existence-only variant of _CONNECTION_LOOKUP, for callers that don't need
+# the Connection row.
+_CONNECTION_EXISTS = (
+    select(literal(1))
+    .where(
+        Connection.id == bindparam("connection_id"),
+        Connection.org_id == bindparam("org_id"),
+    )
+    .limit(1)
+)
+
+
+# Successful connection access checks, (connection_id, org_id) -> expiry time.
+# Only the result is cached, never the session-bound Connection object. Handlers
+# run in the threadpool, so entries are removed from snapshots with pop().
+_CONNECTION_ACCESS_TTL_SECONDS = 30.0
+_CONNECTION_ACCESS_MAX_ENTRIES = 1024
+_verified_connections: dict[tuple[UUID, UUID], float] = {}
+
+
+def check_connection_access(db, connection_id: UUID, org_id: UUID) -> None:
+    """Verify the connection belongs to the org, skipping the query if it was
+    verified recently.
+
+    For endpoints that only need the access check and not the Connection row.
+    """
+    key = (connection_id, org_id)
+    now = time.monotonic()
+    expires_at = _verified_connections.get(key)
+    if expires_at is not None and expires_at > now:
+        return
+
+    exists = db.execute(
+        _CONNECTION_EXISTS, {"connection_id": connection_id, "org_id": org_id}
+    ).scalar()
+    if not exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Connection not found",
+        )
+
+    if len(_verified_connections) >= _CONNECTION_ACCESS_MAX_ENTRIES:
+        for stale_key, exp in list(_verified_connections.items()):
+            if exp <= now:
+                _verified_connections.pop(stale_key, None)
+        if len(_verified_connections) >= _CONNECTION_ACCESS_MAX_ENTRIES:
+            _verified_connections.clear()
+    _verified_connections[key] = now + _CONNECTION_ACCESS_TTL_SECONDS
+
+
+def forget_connection_access(connection_id: UUID) -> None:
+    """Drop cached access checks and responses for a connection, e.g. after it
+    is updated or deleted."""
+    for key in list(_verified_connections):
+        if key[0] == connection_id:
+            _verified_connections.pop(key, None)
+    for key in list(_response_bodies):
+        if key[1] == connection_id:
+            _response_bodies.pop(key, None)
+
+
+# Serialized JSON bodies of GET responses built from synced platform data:
+# (endpoint, connection_id, *params) -> (last_sync_at, expiry time, body).
+# The data only changes with a sync, and a finished sync changes last_sync_at,
+# which invalidates the entries.
+_RESPONSE_BODY_TTL_SECONDS = 30.0
+_RESPONSE_BODY_MAX_ENTRIES = 1024
+_response_bodies: dict[tuple, tuple[datetime | None, float, str]] = {}
+
+
+def _get_cached_body(key: tuple, connection: Connection) -> Response | None:
+    """Return the cached response for key if it is still current."""
+    cached = _response_bodies.get(key)
+    if cached is not None:
+        synced_at, expires_at, body = cached
+        if synced_at == connection.last_sync_at and expires_at > time.monotonic():
+            return Response(content=body, media_type="application/json")
+    return None
+
+
+def _cache_body(key: tuple, connection: Connection, response: BaseModel) -> Response:
+    """Serialize a response once and cache its JSON body.
+
+    The body is returned directly, instead of having FastAPI validate the
+    response again and encode it with json.dumps.
+    """
+    body = response.model_dump_json()
+    if len(_response_bodies) >= _RESPONSE_BODY_MAX_ENTRIES:
+        _response_bodies.clear()
+    _response_bodies[key] = (
+        connection.last_sync_at,
+        time.monotonic() + _RESPONSE_BODY_TTL_SECONDS,
+        body,
+    )
+    return Response(content=body, media_type="application/json")
+
+
 @router.get("/users", response_model=list[PlatformUserResponse])
-async def list_users(
+def list_users(
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
     search: str = Query(None, description="Search by name or email"),
+    after: str = Query(None, description="Return users after this name (keyset pagination)"),
     limit: int = Query(100, le=500),
     offset: int = Query(0),
 ):
     """List all users for a connection."""
-    verify_connection_access(db, connection_id, org_id)
+    check_connection_access(db, connection_id, org_id)
 
     query = select(PlatformUser).where(PlatformUser.connection_id == connection_id)
 
@@ -279,6 +408,11 @@ async def list_users(
             | PlatformUser.email.ilike(f"%{search}%")
         )
 
+    # Names are unique per connection, so the last name of a page is a cursor
+    # that seeks in the (connection_id, name) index instead of skipping rows
+    if after is not None:
+        query = query.where(PlatformUser.name > after)
+
     users = db.execute(
         query.order_by(PlatformUser.name).limit(limit).offset(offset)
     ).scalars().all()
@@ -287,17 +421,18 @@ async def list_users(
 
 
 @router.get("/roles", response_model=list[PlatformRoleResponse])
-async def list_roles(
+def list_roles(
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
     search: str = Query(None, description="Search by name"),
     include_system: bool = Query(True, description="Include system roles"),
+    after: str = Query(None, description="Return roles after this name (keyset pagination)"),
     limit: int = Query(100, le=500),
     offset: int = Query(0),
 ):
     """List all roles for a connection."""
-    verify_connection_access(db, connection_id, org_id)
+    check_connection_access(db, connection_id, org_id)
 
     query = select(PlatformRole).where(PlatformRole.connection_id == connection_id)
 
@@ -307,6 +442,10 @@ async def list_roles(
     if not include_system:
         query = query.where(PlatformRole.is_system == False)
 
+    # Keyset pagination on the unique role name, see list_users
+    if after is not None:
+        query = query.where(PlatformRole.name > after)
+
     roles = db.execute(
         query.order_by(PlatformRole.name).limit(limit).offset(offset)
     ).scalars().all()
@@ -314,47 +453,88 @@ async def list_roles(
     return roles
 
 
+# Only the columns of the assignment and grant responses. The listings return
+# up to thousands of rows, so they skip the ORM entities and the unused
+# platform_data JSON; the rows are read by attribute like the entities were.
+_ROLE_ASSIGNMENT_COLUMNS = (
+    RoleAssignment.id,
+    RoleAssignment.connection_id,
+    RoleAssignment.role_name,
+    RoleAssignment.assignee_type,
+    RoleAssignment.assignee_name,
+    RoleAssignment.assigned_by,
+    RoleAssignment.synced_at,
+)
+_GRANT_COLUMNS = (
+    PlatformGrant.id,
+    PlatformGrant.connection_id,
+    PlatformGrant.privilege,
+    PlatformGrant.object_type,
+    PlatformGrant.object_name,
+    PlatformGrant.object_database,
+    PlatformGrant.object_schema,
+    PlatformGrant.grantee_type,
+    PlatformGrant.grantee_name,
+    PlatformGrant.with_grant_option,
+    PlatformGrant.synced_at,
+)
+
+# The same listings are validated and serialized to JSON in one pass by
+# pydantic-core, instead of FastAPI converting the rows to Python objects and
+# encoding them again with json.dumps
+_ROLE_ASSIGNMENT_LIST = TypeAdapter(list[RoleAssignmentResponse])
+_GRANT_LIST = TypeAdapter(list[PlatformGrantResponse])
+
+
+def _json_list_response(adapter: TypeAdapter, rows) -> Response:
+    """Validate rows against a response list type and return them as JSON."""
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(rows, from_attributes=True)),
+        media_type="application/json",
+    )
+
+
 @router.get("/role-assignments", response_model=list[RoleAssignmentResponse])
-async def list_all_role_assignments(
+def list_all_role_assignments(
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
     limit: int = Query(1000, le=5000),
 ):
     """Get all role assignments for a connection."""
-    verify_connection_access(db, connection_id, org_id)
+    check_connection_access(db, connection_id, org_id)
 
     assignments = db.execute(
-        select(RoleAssignment)
+        select(*_ROLE_ASSIGNMENT_COLUMNS)
         .where(RoleAssignment.connection_id == connection_id)
         .limit(limit)
-    ).scalars().all()
+    ).all()
 
-    return assignments
+    return _json_list_response(_ROLE_ASSIGNMENT_LIST, assignments)
 
 
 @router.get("/roles/{role_name}/assignments", response_model=list[RoleAssignmentResponse])
-async def get_role_assignments(
+def get_role_assignments(
     role_name: str,
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
 ):
     """Get all assignments for a specific role."""
-    verify_connection_access(db, connection_id, org_id)
+    check_connection_access(db, connection_id, org_id)
 
     assignments = db.execute(
-        select(RoleAssignment).where(
+        select(*_ROLE_ASSIGNMENT_COLUMNS).where(
             RoleAssignment.connection_id == connection_id,
             RoleAssignment.role_name == role_name,
         )
-    ).scalars().all()
+    ).all()
 
     return assignments
 
 
 @router.get("/roles/{role_name}/details", response_model=RoleDetailResponse)
-async def get_role_details(
+def get_role_details(
     role_name: str,
     connection_id: UUID,
     org_id: CurrentOrgId,
@@ -368,17 +548,17 @@ async def get_role_details(
 
     This is designed to be called on-demand when a user expands a role card.
     """
-    verify_connection_access(db, connection_id, org_id)
+    check_connection_access(db, connection_id, org_id)
 
     # 1. Get the role to verify it exists
-    role = db.execute(
-        select(PlatformRole).where(
+    role_id = db.execute(
+        select(PlatformRole.id).where(
             PlatformRole.connection_id == connection_id,
             PlatformRole.name == role_name,
         )
     ).scalar_one_or_none()
 
-    if not role:
+    if not role_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Role not found",
@@ -386,13 +566,19 @@ async def get_role_details(
 
     # 2. Get all role assignments to build hierarchy
     all_assignments = db.execute(
-        select(RoleAssignment).where(RoleAssignment.connection_id == connection_id)
-    ).scalars().all()
+        select(
+            RoleAssignment.role_name,
+            RoleAssignment.assignee_type,
+            RoleAssignment.assignee_name,
+        ).where(RoleAssignment.connection_id == connection_id)
+    ).all()
 
     # 3. Get all roles for is_system lookup
     all_roles = db.execute(
-        select(PlatformRole).where(PlatformRole.connection_id == connection_id)
-    ).scalars().all()
+        select(PlatformRole.name, PlatformRole.is_system).where(
+            PlatformRole.connection_id == connection_id
+        )
+    ).all()
     role_info = {r.name: r for r in all_roles}
 
     # 4. Build parent roles (roles this role inherits FROM)
@@ -425,77 +611,17 @@ async def get_role_details(
         if a.role_name.upper() == role_name.upper() and a.assignee_type.upper() == "USER"
     )
 
-    # 7. Get grants and build access map
-    grants = db.execute(
-        select(PlatformGrant).where(
+    # 7. Count grants and build access map (aggregated in SQL)
+    total_privileges = db.execute(
+        select(func.count(PlatformGrant.id)).where(
             PlatformGrant.connection_id == connection_id,
             PlatformGrant.grantee_name == role_name,
             PlatformGrant.grantee_type == "ROLE",
         )
-    ).scalars().all()
-
-    # Build access map structure
-    unique_dbs: set[str] = set()
-    unique_schemas: set[str] = set()
-    has_data_grants = False
-    access_data: dict[str, dict] = {}
-
-    for grant in grants:
-        obj_type = grant.object_type.upper() if grant.object_type else ""
-        db_name = grant.object_database
-        schema_name = grant.object_schema
-        privilege = grant.privilege
-
-        # Skip warehouse grants for access map (they don't represent data access)
-        if obj_type == "WAREHOUSE":
-            continue
+    ).scalar() or 0
 
-        if db_name:
-            unique_dbs.add(db_name)
-            has_data_grants = True
-
-            if db_name not in access_data:
-                access_data[db_name] = {"privileges": set(), "schemas": {}}
-
-            if obj_type == "DATABASE":
-                access_data[db_name]["privileges"].add(privilege)
-
-            if schema_name:
-                unique_schemas.add(f"{db_name}.{schema_name}")
-                if schema_name not in access_data[db_name]["schemas"]:
-                    access_data[db_name]["schemas"][schema_name] = {
-                        "privileges": set(),
-                        "tables": 0,
-                        "views": 0,
-                    }
-                if obj_type == "SCHEMA":
-                    access_data[db_name]["schemas"][schema_name]["privileges"].add(privilege)
-                elif obj_type == "TABLE":
-                    access_data[db_name]["schemas"][schema_name]["tables"] += 1
-                elif obj_type == "VIEW":
-                    access_data[db_name]["schemas"][schema_name]["views"] += 1
-
-    # Convert to response format (using forward-referenced models)
-    # Import here to avoid circular reference issues
-    from src.routers.objects import SchemaAccessDetail, DatabaseAccessDetail
-
-    access_map = []
-    for db_name in sorted(access_data.keys()):
-        db_info = access_data[db_name]
-        schemas_list = []
-        for schema_name in sorted(db_info["schemas"].keys()):
-            schema_info = db_info["schemas"][schema_name]
-            schemas_list.append(SchemaAccessDetail(
-                name=schema_name,
-                table_count=schema_info["tables"],
-                view_count=schema_info["views"],
-                privileges=sorted(list(schema_info["privileges"])),
-            ))
-        access_map.append(DatabaseAccessDetail(
-            name=db_name,
-            privileges=sorted(list(db_info["privileges"])),
-            schemas=schemas_list,
-        ))
+    access_map = _build_access_maps(db, connection_id, role_name).get(role_name, [])
+    has_data_grants = bool(access_map)
 
     # 8. Infer role type
     role_type, reason = infer_role_type(
@@ -505,12 +631,11 @@ async def get_role_details(
     )
 
     # 9. Build compact access summary (first 3 DBs)
-    sorted_dbs = sorted(list(unique_dbs))
     access_summary = RoleAccessSummaryCompact(
-        databases=sorted_dbs[:3],
-        total_databases=len(unique_dbs),
-        total_schemas=len(unique_schemas),
-        total_privileges=len(grants),
+        databases=[d.name for d in access_map[:3]],
+        total_databases=len(access_map),
+        total_schemas=sum(len(d.schemas) for d in access_map),
+        total_privileges=total_privileges,
     )
 
     return RoleDetailResponse(
@@ -534,13 +659,13 @@ class PlatformDatabaseResponse(BaseModel):
 
 
 @router.get("/databases", response_model=list[PlatformDatabaseResponse])
-async def list_databases(
+def list_databases(
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
 ):
     """List all unique databases for a connection with schema counts."""
-    verify_connection_access(db, connection_id, org_id)
+    check_connection_access(db, connection_id, org_id)
 
     # Get unique databases from grants
     db_query = db.execute(
@@ -568,7 +693,7 @@ async def list_databases(
         ).scalar() or 0
 
         # Check if imported
-        is_imported = db_name.upper() in ("SNOWFLAKE_SAMPLE_DATA", "SNOWFLAKE")
+        is_imported = db_name.upper() in _IMPORTED_SENTINEL_DBS
 
         databases.append(PlatformDatabaseResponse(
             name=db_name,
@@ -585,14 +710,14 @@ class SchemaResponse(BaseModel):
 
 
 @router.get("/databases/{database_name}/schemas", response_model=list[SchemaResponse])
-async def list_database_schemas(
+def list_database_schemas(
     database_name: str,
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
 ):
     """List all schemas for a specific database."""
-    verify_connection_access(db, connection_id, org_id)
+    check_connection_access(db, connection_id, org_id)
 
     # Get unique schemas for this database from grants
     schema_query = db.execute(
@@ -616,7 +741,7 @@ async def list_database_schemas(
 
 
 @router.get("/grants", response_model=list[PlatformGrantResponse])
-async def list_grants(
+def list_grants(
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
@@ -627,9 +752,9 @@ async def list_grants(
     offset: int = Query(0),
 ):
     """List all grants for a connection."""
-    verify_connection_access(db, connection_id, org_id)
+    check_connection_access(db, connection_id, org_id)
 
-    query = select(PlatformGrant).where(PlatformGrant.connection_id == connection_id)
+    query = select(*_GRANT_COLUMNS).where(PlatformGrant.connection_id == connection_id)
 
     if grantee_name:
         query = query.where(PlatformGrant.grantee_name == grantee_name)
@@ -645,13 +770,13 @@ async def list_grants(
         ]
         query = query.where(~PlatformGrant.grantee_name.in_(system_roles))
 
-    grants = db.execute(query.limit(limit).offset(offset)).scalars().all()
+    grants = db.execute(query.limit(limit).offset(offset)).all()
 
-    return grants
+    return _json_list_response(_GRANT_LIST, grants)
 
 
 @router.get("/warehouses", response_model=list[PlatformWarehouseResponse])
-async def list_warehouses(
+def list_warehouses(
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
@@ -660,7 +785,7 @@ async def list_warehouses(
     offset: int = Query(0),
 ):
     """List all warehouses for a connection with their grant information."""
-    verify_connection_access(db, connection_id, org_id)
+    check_connection_access(db, connection_id, org_id)
 
     # Get all warehouse grants
     query = select(PlatformGrant).where(
@@ -693,14 +818,13 @@ async def list_warehouses(
 
     # Convert to response format
     warehouses = []
-    for wh_name in sorted(warehouses_data.keys()):
-        data = warehouses_data[wh_name]
+    for _, data in sorted(warehouses_data.items()):
         warehouses.append(PlatformWarehouseResponse(
             name=data["name"],
             connection_id=data["connection_id"],
             grant_count=len(data["roles_with_access"]) * len(data["privileges"]),
-            roles_with_access=sorted(list(data["roles_with_access"])),
-            privileges=sorted(list(data["privileges"])),
+            roles_with_access=sorted(data["roles_with_access"]),
+            privileges=sorted(data["privileges"]),
         ))
 
     # Apply pagination
@@ -709,54 +833,152 @@ async def list_warehouses(
     return warehouses[start:end]
 
 
+# Role inheritance graph per connection, shared by the user access requests:
+# connection_id -> (last_sync_at, expiry time, role children, is_system flags).
+# Like the designer lookups, a finished sync invalidates the entry.
+_ROLE_GRAPH_TTL_SECONDS = 60.0
+_ROLE_GRAPH_MAX_ENTRIES = 256
+_role_graphs: dict[
+    UUID,
+    tuple[datetime | None, float, dict[str, tuple[str, ...]], dict[str, bool]],
+] = {}
+
+
+def _get_role_graph(
+    db, connection: Connection
+) -> tuple[dict[str, tuple[str, ...]], dict[str, bool]]:
+    """Get the role -> child roles map and role is_system flags of a connection,
+    cached briefly. The returned dicts are shared and must not be modified.
+    """
+    now = time.monotonic()
+    cached = _role_graphs.get(connection.id)
+    if cached is not None:
+        synced_at, expires_at, role_children, role_is_system = cached
+        if synced_at == connection.last_sync_at and expires_at > now:
+            return role_children, role_is_system
+
+    # Build role inheritance graph: role -> child roles it grants access to
+    children: dict[str, list[str]] = {}
+    for parent_role, child_role in db.execute(
+        select(RoleAssignment.role_name, RoleAssignment.assignee_name).where(
+            RoleAssignment.connection_id == connection.id,
+            RoleAssignment.assignee_type == "ROLE",
+        )
+    ):
+        children.setdefault(parent_role, []).append(child_role)
+    role_children = {role: tuple(roles) for role, roles in children.items()}
+
+    role_is_system = dict(db.execute(
+        select(PlatformRole.name, PlatformRole.is_system).where(
+            PlatformRole.connection_id == connection.id
+        )
+    ).all())
+
+    if len(_role_graphs) >= _ROLE_GRAPH_MAX_ENTRIES:
+        _role_graphs.clear()
+    _role_graphs[connection.id] = (
+        connection.last_sync_at,
+        now + _ROLE_GRAPH_TTL_SECONDS,
+        role_children,
+        role_is_system,
+    )
+    return role_children, role_is_system
+
+
 @router.get("/users/{user_name}/access", response_model=UserAccessResponse)
-async def get_user_access(
+def get_user_access(
     user_name: str,
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
 ):
     """Get the complete access picture for a user including inherited roles and all grants."""
-    verify_connection_access(db, connection_id, org_id)
+    connection = verify_connection_access(db, connection_id, org_id)
 
-    # Get the user
-    user = db.execute(
-        select(PlatformUser).where(
+    # The response can hold thousands of grants, so its serialized body is
+    # cached until the next sync
+    key = ("user_access", connection_id, user_name)
+    cached = _get_cached_body(key, connection)
+    if cached is not None:
+        return cached
+
+    return _cache_body(key, connection, _build_user_access(db, connection, user_name))
+
+
+def _build_user_access(db, connection: Connection, user_name: str) -> UserAccessResponse:
+    """Resolve a user's roles, inherited roles and grants."""
+    connection_id = connection.id
+
+    # Get the user together with its direct roles in one round-trip. The outer
+    # join gives one row per direct role, or a single row with no role.
+    user_rows = db.execute(
+        select(PlatformUser, RoleAssignment.role_name)
+        .outerjoin(
+            RoleAssignment,
+            and_(
+                RoleAssignment.connection_id == PlatformUser.connection_id,
+                RoleAssignment.assignee_type == "USER",
+                RoleAssignment.assignee_name == PlatformUser.name,
+            ),
+        )
+        .where(
             PlatformUser.connection_id == connection_id,
             PlatformUser.name == user_name,
         )
-    ).scalar_one_or_none()
+    ).all()
 
-    if not user:
+    if not user_rows:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    # Get all role assignments for this connection
-    all_assignments = db.execute(
-        select(RoleAssignment).where(RoleAssignment.connection_id == connection_id)
-    ).scalars().all()
-
-    # Get all roles for this connection (to check is_system)
-    all_roles = db.execute(
-        select(PlatformRole).where(PlatformRole.connection_id == connection_id)
-    ).scalars().all()
-    role_info = {r.name: r for r in all_roles}
+    user = user_rows[0][0]
+    user_direct_roles = [role_name for _, role_name in user_rows if role_name is not None]
+
+    # Users without roles have no access to resolve
+    if not user_direct_roles:
+        return UserAccessResponse(
+            user=user.name,
+            email=user.email,
+            display_name=user.display_name,
+            disabled=user.disabled,
+            roles=[],
+            role_count=0,
+            databases=[],
+            summary=AccessSummary(
+                total_databases=0,
+                total_schemas=0,
+                total_tables=0,
+                total_views=0,
+            ),
+        )
 
-    # Get direct roles for the user
-    user_direct_roles = [
-        a.role_name for a in all_assignments
-        if a.assignee_type == "USER" and a.assignee_name == user_name
-    ]
+    # Walk role inheritance in SQL to find every role reachable from the user's
+    # direct roles, to filter the grants query below. UNION (not UNION ALL)
+    # drops revisited roles, so cycles end.
+    user_roles = (
+        select(RoleAssignment.role_name.label("name"))
+        .where(
+            RoleAssignment.connection_id == connection_id,
+            RoleAssignment.assignee_type == "USER",
+            RoleAssignment.assignee_name == user_name,
+        )
+        .cte("user_roles", recursive=True)
+    )
+    user_roles = user_roles.union(
+        select(RoleAssignment.assignee_name)
+        .join(user_roles, RoleAssignment.role_name == user_roles.c.name)
+        .where(
+            RoleAssignment.connection_id == connection_id,
+            RoleAssignment.assignee_type == "ROLE",
+        )
+    )
+    user_role_names = select(user_roles.c.name)
 
-    # Build role inheritance graph: role -> list of child roles it grants access to
-    role_children: dict[str, list[str]] = {}
-    for assignment in all_assignments:
-        if assignment.assignee_type == "ROLE":
-            if assignment.role_name not in role_children:
-                role_children[assignment.role_name] = []
-            role_children[assignment.role_name].append(assignment.assignee_name)
+    # The role graph is the same for every user of the connection, so it is
+    # shared between requests to build the granted-via paths
+    role_children, role_is_system = _get_role_graph(db, connection)
 
     # Traverse role inheritance to get all roles with their full paths
     roles_with_paths: list[RoleWithPath] = []
@@ -764,45 +986,67 @@ async def get_user_access(
     role_to_path: dict[str, str] = {}
     visited_roles: set[str] = set()
 
-    def traverse_roles(role_name: str, path: list[str]):
+    # Depth-first walk with an explicit stack, starting from the user's direct
+    # roles. Children are pushed in reverse so roles are visited in the same
+    # order as a recursive walk, and each role keeps the first path found.
+    # Entries carry the parent role only: a role's path is its parent's path
+    # plus itself, and the parent's path is final before its children are
+    # pushed.
+    stack: list[tuple[str, str | None]] = [
+        (role_name, None) for role_name in reversed(user_direct_roles)
+    ]
+    while stack:
+        role_name, parent_role = stack.pop()
         if role_name in visited_roles:
-            return
+            continue
         visited_roles.add(role_name)
 
-        current_path = path + [role_name]
-        path_str = " → ".join(current_path)
+        if parent_role is None:
+            path_str = role_name
+        else:
+            path_str = f"{role_to_path[parent_role]} → {role_name}"
         role_to_path[role_name] = path_str
 
-        role_data = role_info.get(role_name)
-        roles_with_paths.append(RoleWithPath(
+        # Built from trusted rows, so skip validation
+        roles_with_paths.append(RoleWithPath.model_construct(
             name=role_name,
             granted_via=path_str,
-            is_inherited=len(path) > 0,
-            is_system=role_data.is_system if role_data else False,
+            is_inherited=parent_role is not None,
+            is_system=role_is_system.get(role_name, False),
         ))
 
         # Traverse child roles
-        for child_role in role_children.get(role_name, []):
-            traverse_roles(child_role, current_path)
-
-    # Start traversal from user's direct roles
-    for role_name in user_direct_roles:
-        traverse_roles(role_name, [])
-
-    # Get all role names the user has access to
-    all_user_roles = list(role_to_path.keys())
+        stack.extend(
+            (child_role, role_name)
+            for child_role in reversed(role_children.get(role_name, ()))
+            if child_role not in visited_roles
+        )
 
-    # Get all grants for these roles
-    if all_user_roles:
-        grants = db.execute(
-            select(PlatformGrant).where(
-                PlatformGrant.connection_id == connection_id,
-                PlatformGrant.grantee_name.in_(all_user_roles),
-                PlatformGrant.grantee_type == "ROLE",
-            )
-        ).scalars().all()
-    else:
-        grants = []
+    # Stream the grants of the roles the user has access to, as plain rows with
+    # only the columns used below. Ordering by object keeps consecutive rows in
+    # the same database/schema bucket while they're grouped.
+    grants = db.execute(
+        select(
+            PlatformGrant.grantee_name,
+            PlatformGrant.privilege,
+            PlatformGrant.object_type,
+            PlatformGrant.object_database,
+            PlatformGrant.object_schema,
+            PlatformGrant.object_name,
+        )
+        .where(
+            PlatformGrant.connection_id == connection_id,
+            PlatformGrant.grantee_name.in_(user_role_names),
+            PlatformGrant.grantee_type == "ROLE",
+        )
+        .order_by(
+            PlatformGrant.object_database,
+            PlatformGrant.object_schema,
+            PlatformGrant.object_type,
+            PlatformGrant.object_name,
+        )
+        .execution_options(yield_per=500)
+    )
 
     # Organize grants by database -> schema -> objects
     # Structure: {db_name: {privileges: [], schemas: {schema_name: {privileges: [], tables: [], views: []}}}}
@@ -818,75 +1062,68 @@ async def get_user_access(
         privilege = grant.privilege
         granted_via = role_to_path.get(grant.grantee_name, grant.grantee_name)
 
-        # Initialize database entry
-        if db_name not in db_data:
-            db_data[db_name] = {"privileges": [], "schemas": {}}
+        # Get or create the database entry with a single lookup on the hit path
+        db_entry = db_data.get(db_name)
+        if db_entry is None:
+            db_entry = db_data[db_name] = {"privileges": [], "schemas": {}}
 
         # Handle database-level privileges
         if obj_type == "DATABASE":
-            db_data[db_name]["privileges"].append(
+            db_entry["privileges"].append(
                 PrivilegeGrant(privilege=privilege, granted_via=granted_via)
             )
         # Handle account-level objects (WAREHOUSE, ROLE, USER, INTEGRATION, etc.)
-        elif obj_type in ("WAREHOUSE", "ROLE", "USER", "INTEGRATION", "NOTIFICATION_INTEGRATION",
-                          "SECURITY_INTEGRATION", "STORAGE_INTEGRATION", "RESOURCE_MONITOR",
-                          "ACCOUNT", "NETWORK_POLICY", "SHARE"):
+        elif obj_type in _ACCOUNT_LEVEL_OBJECT_TYPES:
             # Show as account-level privilege with object info
             priv_display = f"{privilege} on {obj_type} {obj_name}" if obj_name else f"{privilege} on {obj_type}"
             db_data["ACCOUNT"]["privileges"].append(
                 PrivilegeGrant(privilege=priv_display, granted_via=granted_via)
             )
-        # Handle schema-level privileges
-        elif obj_type == "SCHEMA" and schema_name:
-            if schema_name not in db_data[db_name]["schemas"]:
-                db_data[db_name]["schemas"][schema_name] = {
-                    "privileges": [], "tables": [], "views": []
-                }
-            db_data[db_name]["schemas"][schema_name]["privileges"].append(
-                PrivilegeGrant(privilege=privilege, granted_via=granted_via)
-            )
-        # Handle table/view objects
-        elif obj_type in ("TABLE", "VIEW") and schema_name and obj_name:
-            if schema_name not in db_data[db_name]["schemas"]:
-                db_data[db_name]["schemas"][schema_name] = {
-                    "privileges": [], "tables": [], "views": []
-                }
-            target_list = "tables" if obj_type == "TABLE" else "views"
-            db_data[db_name]["schemas"][schema_name][target_list].append(
-                TableAccess(name=obj_name, privilege=privilege, granted_via=granted_via)
-            )
-        # Handle other object types (put in schema if available)
+        # Handle schema-level privileges and objects within a schema
         elif schema_name:
-            if schema_name not in db_data[db_name]["schemas"]:
-                db_data[db_name]["schemas"][schema_name] = {
+            db_schemas = db_entry["schemas"]
+            schema_entry = db_schemas.get(schema_name)
+            if schema_entry is None:
+                schema_entry = db_schemas[schema_name] = {
                     "privileges": [], "tables": [], "views": []
                 }
+
+            if obj_type == "SCHEMA":
+                schema_entry["privileges"].append(
+                    PrivilegeGrant(privilege=privilege, granted_via=granted_via)
+                )
+            # Handle table/view objects
+            elif obj_type in ("TABLE", "VIEW") and obj_name:
+                target_list = "tables" if obj_type == "TABLE" else "views"
+                schema_entry[target_list].append(
+                    TableAccess(name=obj_name, privilege=privilege, granted_via=granted_via)
+                )
             # Treat other objects as tables for display
-            db_data[db_name]["schemas"][schema_name]["tables"].append(
-                TableAccess(
-                    name=f"{obj_name or 'ALL'} ({obj_type})",
-                    privilege=privilege,
-                    granted_via=granted_via
+            else:
+                schema_entry["tables"].append(
+                    TableAccess(
+                        name=f"{obj_name or 'ALL'} ({obj_type})",
+                        privilege=privilege,
+                        granted_via=granted_via
+                    )
                 )
-            )
         # Handle grants without database/schema (put under ACCOUNT)
-        elif not schema_name and obj_name:
+        elif obj_name:
             priv_display = f"{privilege} on {obj_type} {obj_name}" if obj_type else f"{privilege} on {obj_name}"
             db_data["ACCOUNT"]["privileges"].append(
                 PrivilegeGrant(privilege=priv_display, granted_via=granted_via)
             )
 
-    # Convert to response format
+    # Convert to response format. The values come straight from the grant rows
+    # above, so the per-schema and per-database models skip validation.
     databases: list[DatabaseAccess] = []
     total_schemas = 0
 
-    for db_name in sorted(db_data.keys()):
-        data = db_data[db_name]
+    for db_name, data in sorted(db_data.items()):
         schemas_dict: dict[str, SchemaAccess] = {}
 
-        for schema_name in sorted(data["schemas"].keys()):
-            schema_data = data["schemas"][schema_name]
-            schemas_dict[schema_name] = SchemaAccess(
+        for schema_name, schema_data in sorted(data["schemas"].items()):
+            schemas_dict[schema_name] = SchemaAccess.model_construct(
                 name=schema_name,
                 privileges=schema_data["privileges"],
                 tables=schema_data["tables"],
@@ -895,7 +1132,7 @@ async def get_user_access(
             total_tables += len(schema_data["tables"])
             total_views += len(schema_data["views"])
 
-        databases.append(DatabaseAccess(
+        databases.append(DatabaseAccess.model_construct(
             name=db_name,
             privileges=data["privileges"],
             schemas=schemas_dict,
@@ -931,7 +1168,13 @@ class DatabaseInfo(BaseModel):
     is_imported: bool = False  # True for shared/imported databases
 
 
-class SchemaAccessDetail(BaseModel):
+# The access map models below are built once per grant bucket and per role, so
+# they are plain slotted dataclasses rather than validated Pydantic models.
+# Pydantic still serializes them as part of the response models.
+
+
+@dataclass(slots=True)
+class SchemaAccessDetail:
     """Detailed access within a schema for access map visualization."""
     name: str
     table_count: int
@@ -939,18 +1182,18 @@ class SchemaAccessDetail(BaseModel):
     privileges: list[str]  # e.g., ["SELECT", "USAGE"]
 
 
-class DatabaseAccessDetail(BaseModel):
+@dataclass(slots=True)
+class DatabaseAccessDetail:
     """Detailed access within a database for access map visualization."""
     name: str
     privileges: list[str]  # Database-level privileges
     schemas: list[SchemaAccessDetail]
 
 
-class RoleAccessSummary(BaseModel):
+@dataclass(slots=True)
+class RoleAccessSummary:
     """Summary of what a role can access - for inheritance preview."""
     role_name: str
-    description: str | None = None
-    is_system: bool = False  # True for system roles like ACCOUNTADMIN, SYSADMIN, etc.
     database_count: int
     schema_count: int
     table_count: int
@@ -959,8 +1202,85 @@ class RoleAccessSummary(BaseModel):
     # Detailed breakdown for expanded view
     databases: list[str]  # List of database names
     sample_privileges: list[str]  # First few privileges as examples
-    # Detailed access map data
-    access_map: list[DatabaseAccessDetail] = []
+    description: str | None = None
+    is_system: bool = False  # True for system roles like ACCOUNTADMIN, SYSADMIN, etc.
+    # Detailed access map data - left empty by the role designer data, which
+    # serves it per role from /roles/{role_name}/access-map
+    access_map: list[DatabaseAccessDetail] = field(default_factory=list)
+
+
+def _build_access_maps(
+    db, connection_id: UUID, role_name: str | None = None
+) -> dict[str, list[DatabaseAccessDetail]]:
+    """Build the access map for each role, keyed by role name.
+
+    Grants are aggregated in SQL per (role, database, schema), so only one row
+    per schema is loaded instead of one row per grant. Pass role_name to limit
+    the result to a single role.
+    """
+    obj_type = func.upper(PlatformGrant.object_type)
+    query = (
+        select(
+            PlatformGrant.grantee_name,
+            PlatformGrant.object_database,
+            PlatformGrant.object_schema,
+            func.array_agg(distinct(PlatformGrant.privilege)).filter(
+                obj_type == "DATABASE"
+            ),
+            func.array_agg(distinct(PlatformGrant.privilege)).filter(
+                obj_type == "SCHEMA"
+            ),
+            func.count().filter(obj_type == "TABLE"),
+            func.count().filter(obj_type == "VIEW"),
+        )
+        .where(
+            PlatformGrant.connection_id == connection_id,
+            PlatformGrant.grantee_type == "ROLE",
+            # Also excludes NULL databases
+            PlatformGrant.object_database != "",
+            # Warehouse grants don't represent data access
+            obj_type != "WAREHOUSE",
+        )
+        .group_by(
+            PlatformGrant.grantee_name,
+            PlatformGrant.object_database,
+            PlatformGrant.object_schema,
+        )
+    )
+    if role_name is not None:
+        query = query.where(PlatformGrant.grantee_name == role_name)
+
+    # {role_name: {db_name: {privileges: set, schemas: {schema_name: detail}}}}
+    access_data: dict[str, dict[str, dict]] = {}
+    for grantee, db_name, schema_name, db_privs, schema_privs, tables, views in (
+        db.execute(query)
+    ):
+        db_entry = access_data.setdefault(grantee, {}).setdefault(
+            db_name, {"privileges": set(), "schemas": {}}
+        )
+        if db_privs:
+            db_entry["privileges"].update(db_privs)
+        if schema_name:
+            db_entry["schemas"][schema_name] = SchemaAccessDetail(
+                name=schema_name,
+                table_count=tables,
+                view_count=views,
+                privileges=sorted(schema_privs or ()),
+            )
+
+    return {
+        grantee: [
+            DatabaseAccessDetail(
+                name=db_name,
+                privileges=sorted(db_info["privileges"]),
+                schemas=[
+                    detail for _, detail in sorted(db_info["schemas"].items())
+                ],
+            )
+            for db_name, db_info in sorted(databases.items())
+        ]
+        for grantee, databases in access_data.items()
+    }
 
 
 class RoleDesignerData(BaseModel):
@@ -1006,7 +1326,7 @@ class SqlPreviewResponse(BaseModel):
 
 
 @router.get("/role-designer/data", response_model=RoleDesignerData)
-async def get_role_designer_data(
+def get_role_designer_data(
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
@@ -1014,20 +1334,39 @@ async def get_role_designer_data(
     """Get data needed for the role designer (databases, schemas, existing roles, users)."""
     connection = verify_connection_access(db, connection_id, org_id)
 
+    # Fetched every time the designer opens; cached until the next sync
+    key = ("role_designer", connection_id)
+    cached = _get_cached_body(key, connection)
+    if cached is not None:
+        return cached
+
+    return _cache_body(key, connection, _build_role_designer_data(db, connection))
+
+
+def _build_role_designer_data(db, connection: Connection) -> RoleDesignerData:
+    """Collect the databases, warehouses, roles, users and role summaries."""
+    connection_id = connection.id
+
     # Extract service account info from connection config
     conn_config = connection.connection_config or {}
     service_user = conn_config.get("username")
     # Default role is GRANTD_READONLY if not specified
     service_role = conn_config.get("role", "GRANTD_READONLY")
 
-    # Get unique databases from grants
-    db_query = db.execute(
-        select(distinct(PlatformGrant.object_database))
+    # Get unique databases from grants with their schemas in one query. A
+    # database whose grants have no schema comes back once with a NULL schema.
+    schemas_by_db: dict[str, list[str]] = {}
+    for db_name, schema_name in db.execute(
+        select(PlatformGrant.object_database, PlatformGrant.object_schema)
         .where(
             PlatformGrant.connection_id == connection_id,
             PlatformGrant.object_database.isnot(None),
         )
-    ).scalars().all()
+        .distinct()
+    ):
+        db_schemas = schemas_by_db.setdefault(db_name, [])
+        if schema_name:
+            db_schemas.append(schema_name)
 
     # Check for imported databases by looking for IMPORTED PRIVILEGES grants
     imported_dbs_query = db.execute(
@@ -1039,29 +1378,19 @@ async def get_role_designer_data(
     ).scalars().all()
     imported_db_names = set(imported_dbs_query)
 
-    # Get schemas for each database
     databases = []
-    for db_name in sorted(db_query):
+    for db_name, db_schemas in sorted(schemas_by_db.items()):
         if db_name:
-            schema_query = db.execute(
-                select(distinct(PlatformGrant.object_schema))
-                .where(
-                    PlatformGrant.connection_id == connection_id,
-                    PlatformGrant.object_database == db_name,
-                    PlatformGrant.object_schema.isnot(None),
-                )
-            ).scalars().all()
-
             # Check if this is an imported/shared database
             # Detection: has IMPORTED PRIVILEGES grant, or known Snowflake sample data
             is_imported = (
                 db_name in imported_db_names
-                or db_name.upper() in ("SNOWFLAKE_SAMPLE_DATA", "SNOWFLAKE")
+                or db_name.upper() in _IMPORTED_SENTINEL_DBS
             )
 
             databases.append(DatabaseInfo(
                 name=db_name,
-                schemas=sorted([s for s in schema_query if s]),
+                schemas=sorted(db_schemas),
                 is_imported=is_imported,
             ))
 
@@ -1089,112 +1418,82 @@ async def get_role_designer_data(
         .distinct()
         .order_by(PlatformGrant.object_name)
     ).scalars().all()
-    warehouses = sorted([w for w in warehouse_names if w])
+    warehouses = sorted(w for w in warehouse_names if w)
 
     # Build role summaries for inheritance preview
     role_summaries: dict[str, RoleAccessSummary] = {}
 
     # Get all roles with their metadata
     all_roles = db.execute(
-        select(PlatformRole)
+        select(PlatformRole.name, PlatformRole.is_system, PlatformRole.platform_data)
         .where(PlatformRole.connection_id == connection_id)
-    ).scalars().all()
+    ).all()
     role_info = {r.name: r for r in all_roles}
 
-    # Get all grants grouped by role
-    all_grants = db.execute(
-        select(PlatformGrant)
+    # Database, schema, table and view counts per role. The full access map is
+    # only built on demand by get_role_access_map().
+    upper_type = func.upper(PlatformGrant.object_type)
+    access_counts: dict[str, list[tuple[str, int, int, int]]] = {}
+    for grantee, db_name, schema_count, table_count, view_count in db.execute(
+        select(
+            PlatformGrant.grantee_name,
+            PlatformGrant.object_database,
+            func.count(distinct(PlatformGrant.object_schema)).filter(
+                PlatformGrant.object_schema != ""
+            ),
+            func.count().filter(upper_type == "TABLE"),
+            func.count().filter(upper_type == "VIEW"),
+        )
         .where(
             PlatformGrant.connection_id == connection_id,
             PlatformGrant.grantee_type == "ROLE",
+            PlatformGrant.object_database != "",
+            upper_type != "WAREHOUSE",
+        )
+        .group_by(PlatformGrant.grantee_name, PlatformGrant.object_database)
+        .order_by(PlatformGrant.grantee_name, PlatformGrant.object_database)
+    ):
+        access_counts.setdefault(grantee, []).append(
+            (db_name, schema_count, table_count, view_count)
         )
-    ).scalars().all()
 
-    # Group grants by grantee (role name)
-    grants_by_role: dict[str, list] = {}
-    for grant in all_grants:
-        if grant.grantee_name not in grants_by_role:
-            grants_by_role[grant.grantee_name] = []
-        grants_by_role[grant.grantee_name].append(grant)
+    # Total grant count and the first few grants of each role, for the sample
+    # privilege strings
+    ranked_grants = (
+        select(
+            PlatformGrant.grantee_name,
+            PlatformGrant.privilege,
+            PlatformGrant.object_type,
+            PlatformGrant.object_name,
+            PlatformGrant.object_schema,
+            PlatformGrant.object_database,
+            func.row_number()
+            .over(partition_by=PlatformGrant.grantee_name)
+            .label("position"),
+            func.count().over(partition_by=PlatformGrant.grantee_name).label("total"),
+        )
+        .where(
+            PlatformGrant.connection_id == connection_id,
+            PlatformGrant.grantee_type == "ROLE",
+        )
+        .subquery()
+    )
+    privilege_counts: dict[str, int] = {}
+    sample_privileges: dict[str, list[str]] = {}
+    for grant in db.execute(select(ranked_grants).where(ranked_grants.c.position <= 5)):
+        privilege_counts[grant.grantee_name] = grant.total
+        priv_str = grant.privilege
+        obj_type = grant.object_type.upper() if grant.object_type else ""
+        if obj_type:
+            obj_name = (
+                grant.object_name or grant.object_schema or grant.object_database or ""
+            )
+            priv_str = f"{grant.privilege} on {obj_type} {obj_name}"
+        sample_privileges.setdefault(grant.grantee_name, []).append(priv_str)
 
     # Build summary for each role
     for role_name in roles:
-        role_grants = grants_by_role.get(role_name, [])
-
-        # Count unique databases, schemas, tables, views
-        unique_dbs = set()
-        unique_schemas = set()
-        table_count = 0
-        view_count = 0
-        sample_privs = []
-
-        # Build access map structure: {db_name: {privileges: set, schemas: {schema_name: {privileges: set, tables: int, views: int}}}}
-        access_data: dict[str, dict] = {}
-
-        for grant in role_grants:
-            db_name = grant.object_database
-            schema_name = grant.object_schema
-            obj_type = grant.object_type.upper() if grant.object_type else ""
-            privilege = grant.privilege
-
-            if db_name:
-                unique_dbs.add(db_name)
-
-                # Initialize db entry
-                if db_name not in access_data:
-                    access_data[db_name] = {"privileges": set(), "schemas": {}}
-
-                # Database-level privilege
-                if obj_type == "DATABASE":
-                    access_data[db_name]["privileges"].add(privilege)
-
-                # Schema-level access
-                if schema_name:
-                    unique_schemas.add(f"{db_name}.{schema_name}")
-
-                    # Initialize schema entry
-                    if schema_name not in access_data[db_name]["schemas"]:
-                        access_data[db_name]["schemas"][schema_name] = {
-                            "privileges": set(),
-                            "tables": 0,
-                            "views": 0,
-                        }
-
-                    if obj_type == "SCHEMA":
-                        access_data[db_name]["schemas"][schema_name]["privileges"].add(privilege)
-                    elif obj_type == "TABLE":
-                        access_data[db_name]["schemas"][schema_name]["tables"] += 1
-                        table_count += 1
-                    elif obj_type == "VIEW":
-                        access_data[db_name]["schemas"][schema_name]["views"] += 1
-                        view_count += 1
-
-            # Build sample privilege strings (first 5)
-            if len(sample_privs) < 5:
-                priv_str = privilege
-                if obj_type:
-                    obj_name = grant.object_name or schema_name or db_name or ""
-                    priv_str = f"{privilege} on {obj_type} {obj_name}"
-                sample_privs.append(priv_str)
-
-        # Convert access_data to access_map format
-        access_map = []
-        for db_name in sorted(access_data.keys()):
-            db_info = access_data[db_name]
-            schemas_list = []
-            for schema_name in sorted(db_info["schemas"].keys()):
-                schema_info = db_info["schemas"][schema_name]
-                schemas_list.append(SchemaAccessDetail(
-                    name=schema_name,
-                    table_count=schema_info["tables"],
-                    view_count=schema_info["views"],
-                    privileges=sorted(list(schema_info["privileges"])),
-                ))
-            access_map.append(DatabaseAccessDetail(
-                name=db_name,
-                privileges=sorted(list(db_info["privileges"])),
-                schemas=schemas_list,
-            ))
+        db_counts = access_counts.get(role_name, [])
 
         # Get role description and is_system flag
         role_data = role_info.get(role_name)
@@ -1209,14 +1508,13 @@ async def get_role_designer_data(
             role_name=role_name,
             description=description,
             is_system=is_system,
-            database_count=len(unique_dbs),
-            schema_count=len(unique_schemas),
-            table_count=table_count,
-            view_count=view_count,
-            privilege_count=len(role_grants),
-            databases=sorted(list(unique_dbs)),
-            sample_privileges=sample_privs,
-            access_map=access_map,
+            database_count=len(db_counts),
+            schema_count=sum(c[1] for c in db_counts),
+            table_count=sum(c[2] for c in db_counts),
+            view_count=sum(c[3] for c in db_counts),
+            privilege_count=privilege_counts.get(role_name, 0),
+            databases=[c[0] for c in db_counts],
+            sample_privileges=sample_privileges.get(role_name, []),
         )
 
     return RoleDesignerData(
@@ -1230,6 +1528,23 @@ async def get_role_designer_data(
     )
 
 
+@router.get("/roles/{role_name}/access-map", response_model=list[DatabaseAccessDetail])
+def get_role_access_map(
+    role_name: str,
+    connection_id: UUID,
+    org_id: CurrentOrgId,
+    db: DbSession,
+):
+    """Get the detailed access map of a single role.
+
+    The role designer data only carries access counts, so the UI fetches the
+    full map for a role when it is needed.
+    """
+    check_connection_access(db, connection_id, org_id)
+
+    return _build_access_maps(db, connection_id, role_name).get(role_name, [])
+
+
 class RolePrivilegesResponse(BaseModel):
     """Response with a role's current privileges and assignments."""
     role_name: str
@@ -1240,23 +1555,67 @@ class RolePrivilegesResponse(BaseModel):
     assigned_to_roles: list[str]  # Roles this role is granted to (parent roles)
 
 
+def _database_object_name(db_name: str | None, schema_name: str | None, name: str | None) -> str:
+    return db_name or name or ""
+
+
+def _schema_object_name(db_name: str | None, schema_name: str | None, name: str | None) -> str:
+    if db_name and schema_name:
+        return f"{db_name}.{schema_name}"
+    return name or ""
+
+
+def _qualified_object_name(db_name: str | None, schema_name: str | None, name: str | None) -> str:
+    if db_name and schema_name and name:
+        return f"{db_name}.{schema_name}.{name}"
+    return name or ""
+
+
+def _plain_object_name(db_name: str | None, schema_name: str | None, name: str | None) -> str:
+    return name or ""
+
+
+# Object name builders by upper-cased object type, for PrivilegeSpec.object_name
+_OBJ_NAME_BUILDERS = {
+    "DATABASE": _database_object_name,
+    "SCHEMA": _schema_object_name,
+    "TABLE": _qualified_object_name,
+    "VIEW": _qualified_object_name,
+}
+
+
 @router.get("/roles/{role_name}/privileges", response_model=RolePrivilegesResponse)
-async def get_role_privileges(
+def get_role_privileges(
     role_name: str,
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
 ):
     """Get a role's current privileges, inherited roles, and assignments for editing."""
-    verify_connection_access(db, connection_id, org_id)
+    connection = verify_connection_access(db, connection_id, org_id)
+
+    # Cached until the next sync, like the role designer data
+    key = ("role_privileges", connection_id, role_name)
+    cached = _get_cached_body(key, connection)
+    if cached is not None:
+        return cached
+
+    return _cache_body(
+        key, connection, _build_role_privileges(db, connection_id, role_name)
+    )
+
 
+def _build_role_privileges(
+    db, connection_id: UUID, role_name: str
+) -> RolePrivilegesResponse:
+    """Collect a role's privileges, inherited roles and assignments."""
     # Get the role details
     role = db.execute(
-        select(PlatformRole).where(
+        select(PlatformRole.platform_data).where(
             PlatformRole.connection_id == connection_id,
             PlatformRole.name == role_name,
         )
-    ).scalar_one_or_none()
+    ).one_or_none()
 
     if not role:
         raise HTTPException(
@@ -1264,80 +1623,87 @@ async def get_role_privileges(
             detail="Role not found",
         )
 
-    # Get roles that this role inherits from (roles granted TO this role)
-    inherited_roles_query = db.execute(
-        select(RoleAssignment.role_name).where(
-            RoleAssignment.connection_id == connection_id,
-            RoleAssignment.assignee_type == "ROLE",
-            RoleAssignment.assignee_name == role_name,
-        )
-    ).scalars().all()
-
-    # Get users who have this role
-    assigned_users_query = db.execute(
-        select(RoleAssignment.assignee_name).where(
+    # Get inherited roles (roles granted TO this role), users who have this role
+    # and roles this role is granted to (parent roles) in one query
+    assignments = db.execute(
+        select(
+            RoleAssignment.role_name,
+            RoleAssignment.assignee_name,
+            RoleAssignment.assignee_type,
+        ).where(
             RoleAssignment.connection_id == connection_id,
-            RoleAssignment.role_name == role_name,
-            RoleAssignment.assignee_type == "USER",
+            or_(
+                and_(
+                    RoleAssignment.assignee_type == "ROLE",
+                    RoleAssignment.assignee_name == role_name,
+                ),
+                RoleAssignment.role_name == role_name,
+            ),
         )
-    ).scalars().all()
-
-    # Get roles this role is granted to (parent roles in hierarchy)
-    assigned_roles_query = db.execute(
-        select(RoleAssignment.assignee_name).where(
-            RoleAssignment.connection_id == connection_id,
-            RoleAssignment.role_name == role_name,
-            RoleAssignment.assignee_type == "ROLE",
+    ).all()
+
+    inherited_roles: list[str] = []
+    assigned_users: list[str] = []
+    assigned_roles: list[str] = []
+    for assignment in assignments:
+        if assignment.assignee_type == "ROLE" and assignment.assignee_name == role_name:
+            inherited_roles.append(assignment.role_name)
+        if assignment.role_name == role_name:
+            if assignment.assignee_type == "USER":
+                assigned_users.append(assignment.assignee_name)
+            elif assignment.assignee_type == "ROLE":
+                assigned_roles.append(assignment.assignee_name)
+
+    # Get direct grants for this role, flagging grants on imported databases
+    # (databases with an IMPORTED PRIVILEGES grant) in the same query
+    imported_db_names = (
+        select(PlatformGrant.object_database)
+        .where(
+            PlatformGrant.connection_id == connection_id,
+            PlatformGrant.privilege == "IMPORTED PRIVILEGES",
         )
-    ).scalars().all()
-
-    # Get direct grants for this role
+    )
     grants = db.execute(
-        select(PlatformGrant).where(
+        select(
+            PlatformGrant.privilege,
+            PlatformGrant.object_type,
+            PlatformGrant.object_database,
+            PlatformGrant.object_schema,
+            PlatformGrant.object_name,
+            PlatformGrant.object_database.in_(imported_db_names).label("in_imported_db"),
+        ).where(
             PlatformGrant.connection_id == connection_id,
             PlatformGrant.grantee_name == role_name,
             PlatformGrant.grantee_type == "ROLE",
         )
-    ).scalars().all()
-
-    # Check for imported databases
-    imported_dbs_query = db.execute(
-        select(distinct(PlatformGrant.object_database))
-        .where(
-            PlatformGrant.connection_id == connection_id,
-            PlatformGrant.privilege == "IMPORTED PRIVILEGES",
-        )
-    ).scalars().all()
-    imported_db_names = set(imported_dbs_query)
+    ).all()
 
     # Convert grants to PrivilegeSpec format
     privileges = []
     for grant in grants:
+        # Read each grant column once
+        db_name = grant.object_database
+        schema_name = grant.object_schema
+        name = grant.object_name
+        privilege = grant.privilege
+
         # Determine object type and name
         obj_type = grant.object_type.upper() if grant.object_type else ""
 
         # Build object name based on type
-        if obj_type == "DATABASE":
-            obj_name = grant.object_database or grant.object_name or ""
-        elif obj_type == "SCHEMA":
-            obj_name = f"{grant.object_database}.{grant.object_schema}" if grant.object_database and grant.object_schema else grant.object_name or ""
-        elif obj_type in ("TABLE", "VIEW"):
-            if grant.object_database and grant.object_schema and grant.object_name:
-                obj_name = f"{grant.object_database}.{grant.object_schema}.{grant.object_name}"
-            else:
-                obj_name = grant.object_name or ""
-        else:
-            obj_name = grant.object_name or ""
+        obj_name = _OBJ_NAME_BUILDERS.get(obj_type, _plain_object_name)(
+            db_name, schema_name, name
+        )
 
         # Check if this is an imported database privilege
         is_imported = bool(
-            (obj_type == "DATABASE" and grant.privilege == "IMPORTED PRIVILEGES")
-            or grant.object_database in imported_db_names
-            or (grant.object_database and grant.object_database.upper() in ("SNOWFLAKE_SAMPLE_DATA", "SNOWFLAKE"))
+            (obj_type == "DATABASE" and privilege == "IMPORTED PRIVILEGES")
+            or grant.in_imported_db
+            or (db_name and db_name.upper() in _IMPORTED_SENTINEL_DBS)
         )
 
         privileges.append(PrivilegeSpec(
-            privilege=grant.privilege,
+            privilege=privilege,
             object_type=obj_type,
             object_name=obj_name,
             is_imported_database=is_imported,
@@ -1351,115 +1717,185 @@ async def get_role_privileges(
     return RolePrivilegesResponse(
         role_name=role_name,
         description=description,
-        inherited_roles=list(inherited_roles_query),
+        inherited_roles=inherited_roles,
         privileges=privileges,
-        assigned_to_users=list(assigned_users_query),
-        assigned_to_roles=list(assigned_roles_query),
+        assigned_to_users=assigned_users,
+        assigned_to_roles=assigned_roles,
+    )
+
+
+def _priv_key(p: PrivilegeSpec) -> tuple[str, str, str]:
+    """Key used to compare privileges between the original and new design."""
+    return (p.privilege, p.object_type, p.object_name)
+
+
+def _privilege_sql(
+    action: str, privs: list[PrivilegeSpec], role: str
+) -> Iterator[str]:
+    """Yield the GRANT or REVOKE statements for a list of privileges.
+
+    Privileges on the same object are combined into one statement
+    (GRANT USAGE, MONITOR ON DATABASE ...), in order of first appearance.
+    role is the already quoted role identifier.
+    """
+    preposition = "TO" if action == "GRANT" else "FROM"
+    by_object: dict[tuple[str, str, bool], dict[str, None]] = {}
+    for priv in privs:
+        # For imported databases, use IMPORTED PRIVILEGES syntax
+        imported = priv.is_imported_database and priv.object_type.upper() == "DATABASE"
+        key = (priv.object_type, priv.object_name, imported)
+        by_object.setdefault(key, {})[priv.privilege] = None
+
+    for (object_type, object_name, imported), privileges in by_object.items():
+        if imported:
+            yield (
+                f"{action} IMPORTED PRIVILEGES ON DATABASE "
+                f"{quote_object_name(object_name)} {preposition} ROLE {role};"
+            )
+        else:
+            yield (
+                f"{action} {', '.join(privileges)} ON {object_type} "
+                f"{quote_object_name(object_name)} {preposition} ROLE {role};"
+            )
+
+
+class _RoleDesignDiff(NamedTuple):
+    """Items added to and removed from a role design in edit mode."""
+    inherited_added: list[str]
+    inherited_removed: list[str]
+    privileges_added: list[PrivilegeSpec]
+    privileges_removed: list[PrivilegeSpec]
+    users_added: list[str]
+    users_removed: list[str]
+    roles_added: list[str]
+    roles_removed: list[str]
+
+    @property
+    def grants_count(self) -> int:
+        return (
+            len(self.inherited_added) + len(self.privileges_added)
+            + len(self.users_added) + len(self.roles_added)
+        )
+
+    @property
+    def revokes_count(self) -> int:
+        return (
+            len(self.inherited_removed) + len(self.privileges_removed)
+            + len(self.users_removed) + len(self.roles_removed)
+        )
+
+
+def _diff_role_design(design: RoleDesignRequest) -> _RoleDesignDiff:
+    """Compare a role design against its original state, preserving input order."""
+    original_inherited_set = set(design.original_inherited_roles)
+    new_inherited_set = set(design.inherit_from_roles)
+    # Privilege keys are computed once per privilege, for the sets and the diff
+    original_priv_keys = [_priv_key(p) for p in design.original_privileges]
+    new_priv_keys = [_priv_key(p) for p in design.privileges]
+    original_priv_set = set(original_priv_keys)
+    new_priv_set = set(new_priv_keys)
+    original_user_set = set(design.original_assigned_users)
+    new_user_set = set(design.assign_to_users)
+    original_role_set = set(design.original_assigned_roles)
+    new_role_set = set(design.assign_to_roles)
+
+    return _RoleDesignDiff(
+        inherited_added=[
+            r for r in design.inherit_from_roles if r not in original_inherited_set
+        ],
+        inherited_removed=[
+            r for r in design.original_inherited_roles if r not in new_inherited_set
+        ],
+        privileges_added=[
+            p for p, key in zip(design.privileges, new_priv_keys)
+            if key not in original_priv_set
+        ],
+        privileges_removed=[
+            p for p, key in zip(design.original_privileges, original_priv_keys)
+            if key not in new_priv_set
+        ],
+        users_added=[u for u in design.assign_to_users if u not in original_user_set],
+        users_removed=[
+            u for u in design.original_assigned_users if u not in new_user_set
+        ],
+        roles_added=[r for r in design.assign_to_roles if r not in original_role_set],
+        roles_removed=[
+            r for r in design.original_assigned_roles if r not in new_role_set
+        ],
+    )
+
+
+def _gen_edit_statements(role_name: str, diff: _RoleDesignDiff) -> Iterator[str]:
+    """Yield the GRANT/REVOKE statements for an edited role design."""
+    q = quote_identifier
+    role = q(role_name)
+    # Inherited roles
+    yield from (f"GRANT ROLE {q(r)} TO ROLE {role};" for r in diff.inherited_added)
+    yield from (
+        f"REVOKE ROLE {q(r)} FROM ROLE {role};" for r in diff.inherited_removed
     )
+    # Privileges
+    yield from _privilege_sql("GRANT", diff.privileges_added, role)
+    yield from _privilege_sql("REVOKE", diff.privileges_removed, role)
+    # User assignments
+    yield from (f"GRANT ROLE {role} TO USER {q(u)};" for u in diff.users_added)
+    yield from (f"REVOKE ROLE {role} FROM USER {q(u)};" for u in diff.users_removed)
+    # Role assignments
+    yield from (f"GRANT ROLE {role} TO ROLE {q(r)};" for r in diff.roles_added)
+    yield from (f"REVOKE ROLE {role} FROM ROLE {q(r)};" for r in diff.roles_removed)
+
+
+def _gen_create_statements(design: RoleDesignRequest) -> Iterator[str]:
+    """Yield the statements that create a new role design from scratch."""
+    q = quote_identifier
+    role = q(design.role_name)
+
+    # 1. Create the role
+    if design.description:
+        yield (
+            f"CREATE ROLE IF NOT EXISTS {role} "
+            f"COMMENT = {quote_literal(design.description)};"
+        )
+    else:
+        yield f"CREATE ROLE IF NOT EXISTS {role};"
+
+    # 2. Grant inherited roles to the new role
+    yield from (f"GRANT ROLE {q(r)} TO ROLE {role};" for r in design.inherit_from_roles)
+
+    # 3. Grant privileges
+    yield from _privilege_sql("GRANT", design.privileges, role)
+
+    # 4. Assign role to users
+    yield from (f"GRANT ROLE {role} TO USER {q(u)};" for u in design.assign_to_users)
+
+    # 5. Assign role to other roles
+    yield from (f"GRANT ROLE {role} TO ROLE {q(r)};" for r in design.assign_to_roles)
 
 
 @router.post("/role-designer/preview", response_model=SqlPreviewResponse)
-async def preview_role_sql(
+def preview_role_sql(
     design: RoleDesignRequest,
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
 ):
     """Generate SQL preview for a role design."""
-    verify_connection_access(db, connection_id, org_id)
-
-    statements = []
+    check_connection_access(db, connection_id, org_id)
 
     if design.is_edit_mode:
         # EDIT MODE: Generate diff-based SQL (grants and revokes)
-
-        # Helper to create privilege key for comparison
-        def priv_key(p: PrivilegeSpec) -> str:
-            return f"{p.privilege}|{p.object_type}|{p.object_name}"
-
-        original_inherited_set = set(design.original_inherited_roles)
-        new_inherited_set = set(design.inherit_from_roles)
-        original_priv_set = {priv_key(p) for p in design.original_privileges}
-        new_priv_set = {priv_key(p) for p in design.privileges}
-        original_user_set = set(design.original_assigned_users)
-        new_user_set = set(design.assign_to_users)
-        original_role_set = set(design.original_assigned_roles)
-        new_role_set = set(design.assign_to_roles)
-
-        grants_count = 0
-        revokes_count = 0
-
-        # Inherited roles to grant
-        for parent_role in design.inherit_from_roles:
-            if parent_role not in original_inherited_set:
-                statements.append(f"GRANT ROLE {parent_role} TO ROLE {design.role_name};")
-                grants_count += 1
-
-        # Inherited roles to revoke
-        for parent_role in design.original_inherited_roles:
-            if parent_role not in new_inherited_set:
-                statements.append(f"REVOKE ROLE {parent_role} FROM ROLE {design.role_name};")
-                revokes_count += 1
-
-        # Privileges to grant
-        for priv in design.privileges:
-            if priv_key(priv) not in original_priv_set:
-                if priv.is_imported_database and priv.object_type.upper() == "DATABASE":
-                    statements.append(
-                        f"GRANT IMPORTED PRIVILEGES ON DATABASE {priv.object_name} TO ROLE {design.role_name};"
-                    )
-                else:
-                    statements.append(
-                        f"GRANT {priv.privilege} ON {priv.object_type} {priv.object_name} TO ROLE {design.role_name};"
-                    )
-                grants_count += 1
-
-        # Privileges to revoke
-        for priv in design.original_privileges:
-            if priv_key(priv) not in new_priv_set:
-                if priv.is_imported_database and priv.object_type.upper() == "DATABASE":
-                    statements.append(
-                        f"REVOKE IMPORTED PRIVILEGES ON DATABASE {priv.object_name} FROM ROLE {design.role_name};"
-                    )
-                else:
-                    statements.append(
-                        f"REVOKE {priv.privilege} ON {priv.object_type} {priv.object_name} FROM ROLE {design.role_name};"
-                    )
-                revokes_count += 1
-
-        # User assignments to grant
-        for user in design.assign_to_users:
-            if user not in original_user_set:
-                statements.append(f"GRANT ROLE {design.role_name} TO USER {user};")
-                grants_count += 1
-
-        # User assignments to revoke
-        for user in design.original_assigned_users:
-            if user not in new_user_set:
-                statements.append(f"REVOKE ROLE {design.role_name} FROM USER {user};")
-                revokes_count += 1
-
-        # Role assignments to grant
-        for role in design.assign_to_roles:
-            if role not in original_role_set:
-                statements.append(f"GRANT ROLE {design.role_name} TO ROLE {role};")
-                grants_count += 1
-
-        # Role assignments to revoke
-        for role in design.original_assigned_roles:
-            if role not in new_role_set:
-                statements.append(f"REVOKE ROLE {design.role_name} FROM ROLE {role};")
-                revokes_count += 1
+        diff = _diff_role_design(design)
+        statements = list(_gen_edit_statements(design.role_name, diff))
 
         if not statements:
             statements.append(f"-- No changes to role {design.role_name}")
 
         summary = f"Modifies role {design.role_name}"
         parts = []
-        if grants_count > 0:
-            parts.append(f"{grants_count} grant(s)")
-        if revokes_count > 0:
-            parts.append(f"{revokes_count} revoke(s)")
+        if diff.grants_count > 0:
+            parts.append(f"{diff.grants_count} grant(s)")
+        if diff.revokes_count > 0:
+            parts.append(f"{diff.revokes_count} revoke(s)")
         if parts:
             summary += f" with {' and '.join(parts)}"
         else:
@@ -1467,38 +1903,7 @@ async def preview_role_sql(
 
     else:
         # CREATE MODE: Generate all grants
-
-        # 1. Create the role
-        comment = design.description or ""
-        create_sql = f"CREATE ROLE IF NOT EXISTS {design.role_name}"
-        if comment:
-            create_sql += f" COMMENT = '{comment}'"
-        create_sql += ";"
-        statements.append(create_sql)
-
-        # 2. Grant inherited roles to the new role
-        for parent_role in design.inherit_from_roles:
-            statements.append(f"GRANT ROLE {parent_role} TO ROLE {design.role_name};")
-
-        # 3. Grant privileges
-        for priv in design.privileges:
-            # For imported databases, use IMPORTED PRIVILEGES syntax
-            if priv.is_imported_database and priv.object_type.upper() == "DATABASE":
-                statements.append(
-                    f"GRANT IMPORTED PRIVILEGES ON DATABASE {priv.object_name} TO ROLE {design.role_name};"
-                )
-            else:
-                statements.append(
-                    f"GRANT {priv.privilege} ON {priv.object_type} {priv.object_name} TO ROLE {design.role_name};"
-                )
-
-        # 4. Assign role to users
-        for user in design.assign_to_users:
-            statements.append(f"GRANT ROLE {design.role_name} TO USER {user};")
-
-        # 5. Assign role to other roles
-        for role in design.assign_to_roles:
-            statements.append(f"GRANT ROLE {design.role_name} TO ROLE {role};")
+        statements = list(_gen_create_statements(design))
 
         summary = f"Creates role {design.role_name}"
         if design.inherit_from_roles:
@@ -1531,14 +1936,14 @@ class WarehouseDesignRequest(BaseModel):
 
 
 @router.post("/warehouse-designer/preview", response_model=SqlPreviewResponse)
-async def preview_warehouse_sql(
+def preview_warehouse_sql(
     design: WarehouseDesignRequest,
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
 ):
     """Generate SQL preview for a warehouse design."""
-    verify_connection_access(db, connection_id, org_id)
+    check_connection_access(db, connection_id, org_id)
 
     statements = []
 
@@ -1557,7 +1962,7 @@ async def preview_warehouse_sql(
 
         if changes:
             statements.append(
-                f"ALTER WAREHOUSE {design.warehouse_name} SET {', '.join(changes)};"
+                f"ALTER WAREHOUSE {quote_identifier(design.warehouse_name)} SET {', '.join(changes)};"
             )
             summary = f"Alters warehouse {design.warehouse_name} with {len(changes)} change(s)"
         else:
@@ -1565,14 +1970,14 @@ async def preview_warehouse_sql(
             summary = f"No changes to warehouse {design.warehouse_name}"
     else:
         # CREATE WAREHOUSE mode
-        create_sql = f"""CREATE WAREHOUSE IF NOT EXISTS {design.warehouse_name}
+        create_sql = f"""CREATE WAREHOUSE IF NOT EXISTS {quote_identifier(design.warehouse_name)}
     WITH WAREHOUSE_SIZE = {design.warehouse_size}
     AUTO_SUSPEND = {design.auto_suspend}
     AUTO_RESUME = {str(design.auto_resume).upper()}
     INITIALLY_SUSPENDED = {str(design.initially_suspended).upper()}"""
 
         if design.comment:
-            create_sql += f"\n    COMMENT = '{design.comment}'"
+            create_sql += f"\n    COMMENT = {quote_literal(design.comment)}"
 
         create_sql += ";"
         statements.append(create_sql)
@@ -1608,64 +2013,66 @@ class UserDesignRequest(BaseModel):
     original_roles: list[str] = []
 
 
+# Editable user properties: (SQL property, UserDesignRequest field, renderer).
+# String properties are rendered as literals, object references as identifiers.
+# Edit mode compares each field against its original_<field> counterpart.
+_USER_PROPERTY_FIELDS = (
+    ("DISPLAY_NAME", "display_name", quote_literal),
+    ("EMAIL", "email", quote_literal),
+    ("DEFAULT_ROLE", "default_role", quote_identifier),
+    ("DEFAULT_WAREHOUSE", "default_warehouse", quote_identifier),
+)
+_USER_CREATE_FIELDS = (("LOGIN_NAME", "login_name", quote_literal), *_USER_PROPERTY_FIELDS)
+
+
 @router.post("/user-designer/preview", response_model=SqlPreviewResponse)
-async def preview_user_sql(
+def preview_user_sql(
     design: UserDesignRequest,
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
 ):
     """Generate SQL preview for a user design."""
-    verify_connection_access(db, connection_id, org_id)
+    check_connection_access(db, connection_id, org_id)
 
     statements = []
+    user = quote_identifier(design.user_name)
 
     if design.is_edit_mode:
         # ALTER USER mode
-        changes = []
-
-        if design.original_display_name is not None and design.display_name != design.original_display_name:
-            if design.display_name:
-                changes.append(f"DISPLAY_NAME = '{design.display_name}'")
-
-        if design.original_email is not None and design.email != design.original_email:
-            if design.email:
-                changes.append(f"EMAIL = '{design.email}'")
-
-        if design.original_default_role is not None and design.default_role != design.original_default_role:
-            if design.default_role:
-                changes.append(f"DEFAULT_ROLE = {design.default_role}")
-
-        if design.original_default_warehouse is not None and design.default_warehouse != design.original_default_warehouse:
-            if design.default_warehouse:
-                changes.append(f"DEFAULT_WAREHOUSE = {design.default_warehouse}")
+        changes = [
+            f"{sql_name} = {render(value)}"
+            for sql_name, attr, render in _USER_PROPERTY_FIELDS
+            if (original := getattr(design, f"original_{attr}")) is not None
+            and (value := getattr(design, attr)) != original
+            and value
+        ]
 
         if design.original_disabled is not None and design.disabled != design.original_disabled:
             changes.append(f"DISABLED = {str(design.disabled).upper()}")
 
         if changes:
             statements.append(
-                f"ALTER USER {design.user_name} SET {', '.join(changes)};"
+                f"ALTER USER {user} SET {', '.join(changes)};"
             )
 
-        # Handle role changes
-        original_role_set = set(design.original_roles)
-        new_role_set = set(design.roles)
-
-        grants_count = 0
-        revokes_count = 0
-
-        # Roles to grant
-        for role in design.roles:
-            if role not in original_role_set:
-                statements.append(f"GRANT ROLE {role} TO USER {design.user_name};")
-                grants_count += 1
-
-        # Roles to revoke
-        for role in design.original_roles:
-            if role not in new_role_set:
-                statements.append(f"REVOKE ROLE {role} FROM USER {design.user_name};")
-                revokes_count += 1
+        # Handle role changes. dict.fromkeys keeps the request order (and drops
+        # duplicates) so the statements come out in a deterministic order.
+        original_roles = dict.fromkeys(design.original_roles)
+        new_roles = dict.fromkeys(design.roles)
+        roles_to_grant = [role for role in new_roles if role not in original_roles]
+        roles_to_revoke = [role for role in original_roles if role not in new_roles]
+        grants_count = len(roles_to_grant)
+        revokes_count = len(roles_to_revoke)
+
+        statements.extend(
+            f"GRANT ROLE {quote_identifier(role)} TO USER {user};"
+            for role in roles_to_grant
+        )
+        statements.extend(
+            f"REVOKE ROLE {quote_identifier(role)} FROM USER {user};"
+            for role in roles_to_revoke
+        )
 
         if not statements:
             statements.append(f"-- No changes to user {design.user_name}")
@@ -1684,30 +2091,24 @@ async def preview_user_sql(
 
     else:
         # CREATE USER mode
-        create_parts = [f"CREATE USER IF NOT EXISTS {design.user_name}"]
-
-        if design.login_name:
-            create_parts.append(f"LOGIN_NAME = '{design.login_name}'")
-        if design.display_name:
-            create_parts.append(f"DISPLAY_NAME = '{design.display_name}'")
-        if design.email:
-            create_parts.append(f"EMAIL = '{design.email}'")
-        if design.default_role:
-            create_parts.append(f"DEFAULT_ROLE = {design.default_role}")
-        if design.default_warehouse:
-            create_parts.append(f"DEFAULT_WAREHOUSE = {design.default_warehouse}")
-
-        create_parts.append(f"MUST_CHANGE_PASSWORD = {str(design.must_change_password).upper()}")
-        create_parts.append(f"DISABLED = {str(design.disabled).upper()}")
-
+        create_parts = [
+            f"CREATE USER IF NOT EXISTS {user}",
+            *(
+                f"{sql_name} = {render(value)}"
+                for sql_name, attr, render in _USER_CREATE_FIELDS
+                if (value := getattr(design, attr))
+            ),
+            f"MUST_CHANGE_PASSWORD = {str(design.must_change_password).upper()}",
+            f"DISABLED = {str(design.disabled).upper()}",
+        ]
         if design.comment:
-            create_parts.append(f"COMMENT = '{design.comment}'")
+            create_parts.append(f"COMMENT = {quote_literal(design.comment)}")
 
         statements.append("\n    ".join(create_parts) + ";")
 
         # Grant roles to the new user
         for role in design.roles:
-            statements.append(f"GRANT ROLE {role} TO USER {design.user_name};")
+            statements.append(f"GRANT ROLE {quote_identifier(role)} TO USER {user};")
 
         summary = f"Creates user {design.user_name}"
         if design.roles:
@@ -1716,8 +2117,59 @@ async def preview_user_sql(
     return SqlPreviewResponse(statements=statements, summary=summary)
 
 
+# Role and warehouse names per connection for the user designer:
+# connection_id -> (last_sync_at, expiry time, roles, warehouses).
+# A finished sync changes last_sync_at, which invalidates the entry.
+_DESIGNER_LOOKUP_TTL_SECONDS = 60.0
+_DESIGNER_LOOKUP_MAX_ENTRIES = 256
+_designer_lookups: dict[
+    UUID, tuple[datetime | None, float, tuple[str, ...], tuple[str, ...]]
+] = {}
+
+
+def _get_designer_lookups(
+    db, connection: Connection
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Get the sorted role and warehouse names of a connection, cached briefly."""
+    now = time.monotonic()
+    cached = _designer_lookups.get(connection.id)
+    if cached is not None:
+        synced_at, expires_at, roles, warehouses = cached
+        if synced_at == connection.last_sync_at and expires_at > now:
+            return roles, warehouses
+
+    # Get available roles (names are unique per connection)
+    roles = tuple(db.execute(
+        select(PlatformRole.name)
+        .where(PlatformRole.connection_id == connection.id)
+        .order_by(PlatformRole.name)
+    ).scalars())
+
+    # Get warehouses
+    warehouses = tuple(db.execute(
+        select(distinct(PlatformGrant.object_name))
+        .where(
+            PlatformGrant.connection_id == connection.id,
+            PlatformGrant.object_type == "WAREHOUSE",
+            # Also excludes NULL names
+            PlatformGrant.object_name != "",
+        )
+        .order_by(PlatformGrant.object_name)
+    ).scalars())
+
+    if len(_designer_lookups) >= _DESIGNER_LOOKUP_MAX_ENTRIES:
+        _designer_lookups.clear()
+    _designer_lookups[connection.id] = (
+        connection.last_sync_at,
+        now + _DESIGNER_LOOKUP_TTL_SECONDS,
+        roles,
+        warehouses,
+    )
+    return roles, warehouses
+
+
 @router.get("/user-designer/data")
-async def get_user_designer_data(
+def get_user_designer_data(
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
@@ -1726,22 +2178,7 @@ async def get_user_designer_data(
     """Get data needed for the user designer (roles, warehouses, and optionally user details)."""
     connection = verify_connection_access(db, connection_id, org_id)
 
-    # Get available roles
-    roles_query = db.execute(
-        select(PlatformRole.name).where(
-            PlatformRole.connection_id == connection_id,
-        )
-    ).scalars().all()
-    roles = sorted(set(roles_query))
-
-    # Get warehouses
-    wh_query = db.execute(
-        select(distinct(PlatformGrant.object_name)).where(
-            PlatformGrant.connection_id == connection_id,
-            PlatformGrant.object_type == "WAREHOUSE",
-        )
-    ).scalars().all()
-    warehouses = sorted([w for w in wh_query if w])
+    roles, warehouses = _get_designer_lookups(db, connection)
 
     # Get service account info
     conn_config = connection.connection_config or {}
@@ -1749,8 +2186,8 @@ async def get_user_designer_data(
     service_role = conn_config.get("role", "GRANTD_READONLY")
 
     result = {
-        "roles": roles,
-        "warehouses": warehouses,
+        "roles": list(roles),
+        "warehouses": list(warehouses),
         "service_user": service_user,
         "service_role": service_role,
     }
@@ -1758,11 +2195,17 @@ async def get_user_designer_data(
     # If editing a user, get their current data
     if user_name:
         user = db.execute(
-            select(PlatformUser).where(
+            select(
+                PlatformUser.name,
+                PlatformUser.email,
+                PlatformUser.display_name,
+                PlatformUser.disabled,
+                PlatformUser.platform_data,
+            ).where(
                 PlatformUser.connection_id == connection_id,
                 PlatformUser.name == user_name,
             )
-        ).scalar_one_or_none()
+        ).one_or_none()
 
         if user:
             # Get user's current roles
@@ -1789,32 +2232,37 @@ async def get_user_designer_data(
 
 
 @router.get("/warehouse-designer/data")
-async def get_warehouse_designer_data(
+def get_warehouse_designer_data(
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
     warehouse_name: str | None = Query(None, description="Warehouse name to edit"),
 ):
     """Get data needed for the warehouse designer."""
-    verify_connection_access(db, connection_id, org_id)
+    check_connection_access(db, connection_id, org_id)
 
     result: dict = {}
 
-    # If editing a warehouse, get its current data from grants
+    # If editing a warehouse, get its current data from grants. Roles and
+    # privileges are deduplicated (and sorted) in SQL, in a single row.
     if warehouse_name:
-        grants = db.execute(
-            select(PlatformGrant).where(
+        roles_with_access, privileges = db.execute(
+            select(
+                func.array_agg(distinct(PlatformGrant.grantee_name)),
+                func.array_agg(distinct(PlatformGrant.privilege)),
+            ).where(
                 PlatformGrant.connection_id == connection_id,
                 PlatformGrant.object_type == "WAREHOUSE",
                 PlatformGrant.object_name == warehouse_name,
             )
-        ).scalars().all()
+        ).one()
 
-        if grants:
+        # The aggregates are NULL when the warehouse has no grants
+        if roles_with_access:
             result["warehouse"] = {
                 "name": warehouse_name,
-                "roles_with_access": list(set(g.grantee_name for g in grants)),
-                "privileges": list(set(g.privilege for g in grants)),
+                "roles_with_access": roles_with_access,
+                "privileges": privileges,
             }
 
     return result
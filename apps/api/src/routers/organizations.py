@@ -1,5 +1,3 @@
-from uuid import UUID
-
 from fastapi import APIRouter, HTTPException, status
 from sqlalchemy import select
 
@@ -11,13 +9,13 @@ router = APIRouter(prefix="/organizations")
 
 
 @router.get("/current", response_model=OrganizationResponse)
-async def get_current_organization(
+def get_current_organization(
     org_id: CurrentOrgId,
     db: DbSession,
 ):
     """Get the current user's organization."""
     org = db.execute(
-        select(Organization).where(Organization.id == UUID(org_id))
+        select(Organization).where(Organization.id == org_id)
     ).scalar_one_or_none()
 
     if not org:
@@ -30,13 +28,13 @@ async def get_current_organization(
 
 
 @router.get("/current/members", response_model=list[OrgMemberResponse])
-async def get_organization_members(
+def get_organization_members(
     org_id: CurrentOrgId,
     db: DbSession,
 ):
     """Get all members of the current organization."""
     members = db.execute(
-        select(OrgMember).where(OrgMember.org_id == UUID(org_id))
+        select(OrgMember).where(OrgMember.org_id == org_id)
     ).scalars().all()
 
     return members
@@ -1,18 +1,41 @@
 from uuid import UUID
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, select
 
 from src.dependencies import CurrentOrgId, CurrentUser, DbSession
 from src.models.database import Connection, SyncRun
 from src.models.schemas import SyncStatusResponse, SyncTriggerRequest
+from src.routers.objects import check_connection_access
 from src.services.sync.service import run_sync
 
 router = APIRouter(prefix="/sync")
 
+# Latest sync runs of a connection, built once and executed with parameters.
+# The progress endpoint is polled during a sync.
+_RECENT_SYNC_RUNS = (
+    select(SyncRun)
+    .where(SyncRun.connection_id == bindparam("connection_id"))
+    .order_by(SyncRun.started_at.desc())
+    .limit(bindparam("limit"))
+)
+
+# Latest sync run of a connection, joined against the connection so the org
+# check happens in the same query. Served by idx_sync_runs_connection.
+_LATEST_SYNC_RUN_FOR_ORG = (
+    select(SyncRun)
+    .join(Connection, SyncRun.connection_id == Connection.id)
+    .where(
+        SyncRun.connection_id == bindparam("connection_id"),
+        Connection.org_id == bindparam("org_id"),
+    )
+    .order_by(SyncRun.started_at.desc())
+    .limit(1)
+)
+
 
 @router.post("/trigger", response_model=SyncStatusResponse)
-async def trigger_sync(
+def trigger_sync(
     request: SyncTriggerRequest,
     org_id: CurrentOrgId,
     user: CurrentUser,
@@ -21,36 +44,39 @@ async def trigger_sync(
 ):
     """Trigger a sync for a connection."""
     # Verify connection belongs to org
-    connection = db.execute(
-        select(Connection).where(
+    connection_id = db.execute(
+        select(Connection.id).where(
             Connection.id == request.connection_id,
-            Connection.org_id == UUID(org_id),
+            Connection.org_id == org_id,
         )
     ).scalar_one_or_none()
 
-    if not connection:
+    if not connection_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Connection not found",
         )
 
-    # Create sync run record
-    sync_run = SyncRun(
-        connection_id=request.connection_id,
-        triggered_by=user.get("email"),
-    )
-    db.add(sync_run)
+    # Create sync run record. RETURNING gives back the row with its defaults
+    # filled in, as a plain row that the commit doesn't expire.
+    sync_run = db.execute(
+        insert(SyncRun)
+        .values(
+            connection_id=request.connection_id,
+            triggered_by=user.get("email"),
+        )
+        .returning(*SyncRun.__table__.columns)
+    ).one()
     db.commit()
-    db.refresh(sync_run)
 
     # Trigger background sync
-    background_tasks.add_task(run_sync, str(sync_run.id), str(connection.id))
+    background_tasks.add_task(run_sync, str(sync_run.id), str(connection_id))
 
     return sync_run
 
 
 @router.get("/status/{connection_id}", response_model=list[SyncStatusResponse])
-async def get_sync_status(
+def get_sync_status(
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
@@ -58,31 +84,17 @@ async def get_sync_status(
 ):
     """Get recent sync runs for a connection."""
     # Verify connection belongs to org
-    connection = db.execute(
-        select(Connection).where(
-            Connection.id == connection_id,
-            Connection.org_id == UUID(org_id),
-        )
-    ).scalar_one_or_none()
-
-    if not connection:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Connection not found",
-        )
+    check_connection_access(db, connection_id, org_id)
 
     sync_runs = db.execute(
-        select(SyncRun)
-        .where(SyncRun.connection_id == connection_id)
-        .order_by(SyncRun.started_at.desc())
-        .limit(limit)
+        _RECENT_SYNC_RUNS, {"connection_id": connection_id, "limit": limit}
     ).scalars().all()
 
     return sync_runs
 
 
 @router.get("/progress/{connection_id}", response_model=SyncStatusResponse | None)
-async def get_sync_progress(
+def get_sync_progress(
     connection_id: UUID,
     org_id: CurrentOrgId,
     db: DbSession,
@@ -92,26 +104,13 @@ async def get_sync_progress(
     This endpoint is optimized for polling during an active sync.
     Returns the most recent sync run (running or completed).
     """
-    # Verify connection belongs to org
-    connection = db.execute(
-        select(Connection).where(
-            Connection.id == connection_id,
-            Connection.org_id == UUID(org_id),
-        )
-    ).scalar_one_or_none()
-
-    if not connection:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Connection not found",
-        )
-
-    # Get the most recent sync run
+    # A run can only be found if the connection belongs to the org, so the
+    # separate access check is only needed when there is none.
     sync_run = db.execute(
-        select(SyncRun)
-        .where(SyncRun.connection_id == connection_id)
-        .order_by(SyncRun.started_at.desc())
-        .limit(1)
+        _LATEST_SYNC_RUN_FOR_ORG, {"connection_id": connection_id, "org_id": org_id}
     ).scalar_one_or_none()
 
+    if sync_run is None:
+        check_connection_access(db, connection_id, org_id)
+
     return sync_run
@@ -0,0 +1,28 @@
+from functools import lru_cache
+
+import boto3
+
+from src.config import get_settings
+
+
+@lru_cache
+def get_ssm_client():
+    """Get the SSM client, created once per process.
+
+    Creating a boto3 client resolves credentials and loads the service model,
+    which is slow; clients are thread-safe, so one is shared by all requests
+    and syncs.
+    """
+    return boto3.client("ssm", region_name=get_settings().aws_region)
+
+
+def get_parameter(name: str) -> str:
+    """Get the decrypted value of a SecureString parameter.
+
+    Not cached: decrypted keys aren't kept in memory beyond the call that needs
+    them, and every instance sees a rotated key right away.
+
+    Raises botocore's ClientError if the parameter can't be read.
+    """
+    response = get_ssm_client().get_parameter(Name=name, WithDecryption=True)
+    return response["Parameter"]["Value"]
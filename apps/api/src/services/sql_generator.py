@@ -1,4 +1,71 @@
-from typing import Any
+import re
+from functools import lru_cache
+from typing import Any, Iterable
+
+# Names that Snowflake accepts unquoted and resolves to themselves: upper-case
+# letter or underscore, then upper-case letters, digits, underscores or dollar
+# signs. Unquoted names are folded to upper case, so anything with lower-case
+# letters must be quoted to keep its exact spelling.
+_PLAIN_IDENTIFIER_RE = re.compile(r"[A-Z_][A-Z0-9_$]*")
+
+# One part of a dotted object name: an already double-quoted identifier (with ""
+# for an embedded quote), which may contain dots, or a run of anything but dots
+_NAME_PART_RE = re.compile(r'(?P<quoted>"(?:[^"]|"")*")(?=\.|$)|(?P<plain>[^.]*)')
+
+
+@lru_cache(maxsize=4096)
+def quote_identifier(name: str) -> str:
+    """Render a Snowflake identifier, quoting it only if it needs quotes.
+
+    Names are taken as exact (as SHOW commands return them). Upper-case plain
+    names are left as they are; anything else (lower case, punctuation, spaces,
+    embedded quotes) is wrapped in double quotes with inner double quotes
+    doubled, so Snowflake doesn't fold or misparse it.
+    """
+    if _PLAIN_IDENTIFIER_RE.fullmatch(name):
+        return name
+    return '"' + name.replace('"', '""') + '"'
+
+
+def quote_object_name(name: str) -> str:
+    """Render a dotted object name (DB, DB.SCHEMA, DB.SCHEMA.TABLE) part by part.
+
+    Parts that are already double-quoted, the way Snowflake prints names that
+    need quotes, are kept as they are, and dots inside them don't split.
+    """
+    parts = []
+    pos = 0
+    while True:
+        match = _NAME_PART_RE.match(name, pos)
+        quoted = match["quoted"]
+        parts.append(quoted if quoted is not None else quote_identifier(match["plain"]))
+        pos = match.end() + 1
+        if pos > len(name):
+            return ".".join(parts)
+
+
+def quote_literal(value: str) -> str:
+    """Render a single-quoted SQL string literal."""
+    return "'" + value.replace("\\", "\\\\").replace("'", "''") + "'"
+
+
+# Optional string properties of create_user changes: (SQL property, details key)
+_CREATE_USER_PROPERTIES = (
+    ("EMAIL", "email"),
+    ("FIRST_NAME", "first_name"),
+    ("LAST_NAME", "last_name"),
+    ("DISPLAY_NAME", "display_name"),
+    ("COMMENT", "comment"),
+    ("DEFAULT_NAMESPACE", "default_namespace"),
+)
+
+
+def _ident(name: Any) -> str:
+    return quote_identifier(name) if isinstance(name, str) else str(name)
+
+
+def _object_name(name: Any) -> str:
+    return quote_object_name(name) if isinstance(name, str) else str(name)
 
 
 def generate_sql_for_change(
@@ -17,6 +84,24 @@ def generate_sql_for_change(
         raise ValueError(f"Unsupported platform: {platform}")
 
 
+def generate_sql_for_changes(platform: str, changes: Iterable) -> list[str]:
+    """Generate platform-specific SQL for a batch of changes, in order.
+
+    Each change has change_type, object_type, object_name and details
+    attributes, like ChangeCreate. The platform is resolved once for the batch.
+    """
+    if platform == "snowflake":
+        generate = _generate_snowflake_sql
+    elif platform == "databricks":
+        generate = _generate_databricks_sql
+    else:
+        raise ValueError(f"Unsupported platform: {platform}")
+    return [
+        generate(change.change_type, change.object_type, change.object_name, change.details)
+        for change in changes
+    ]
+
+
 def _generate_snowflake_sql(
     change_type: str,
     object_type: str,
@@ -24,38 +109,39 @@ def _generate_snowflake_sql(
     details: dict[str, Any],
 ) -> str:
     """Generate Snowflake-specific SQL."""
+    name = _ident(object_name)
     match change_type:
         case "create_role":
             comment = details.get("comment", "")
-            sql = f"CREATE ROLE IF NOT EXISTS {object_name}"
+            sql = f"CREATE ROLE IF NOT EXISTS {name}"
             if comment:
-                sql += f" COMMENT = '{comment}'"
+                sql += f" COMMENT = {quote_literal(comment)}"
             return sql + ";"
 
         case "drop_role":
-            return f"DROP ROLE IF EXISTS {object_name};"
+            return f"DROP ROLE IF EXISTS {name};"
 
         case "grant_role":
             grantee = details.get("grantee")
             grantee_type = details.get("grantee_type", "USER").upper()
-            return f"GRANT ROLE {object_name} TO {grantee_type} {grantee};"
+            return f"GRANT ROLE {name} TO {grantee_type} {_ident(grantee)};"
 
         case "revoke_role":
             grantee = details.get("grantee")
             grantee_type = details.get("grantee_type", "USER").upper()
-            return f"REVOKE ROLE {object_name} FROM {grantee_type} {grantee};"
+            return f"REVOKE ROLE {name} FROM {grantee_type} {_ident(grantee)};"
 
         case "grant" if object_type == "role_assignment":
             # Canvas-style role assignment: grant role to user
             user_name = details.get("user_name")
             role_name = details.get("role_name")
-            return f"GRANT ROLE {role_name} TO USER {user_name};"
+            return f"GRANT ROLE {_ident(role_name)} TO USER {_ident(user_name)};"
 
         case "revoke" if object_type == "role_assignment":
             # Canvas-style role revocation: revoke role from user
             user_name = details.get("user_name")
             role_name = details.get("role_name")
-            return f"REVOKE ROLE {role_name} FROM USER {user_name};"
+            return f"REVOKE ROLE {_ident(role_name)} FROM USER {_ident(user_name)};"
 
         case "grant_privilege":
             privilege = details.get("privilege")
@@ -66,9 +152,12 @@ def _generate_snowflake_sql(
 
             # For imported/shared databases, use IMPORTED PRIVILEGES
             if is_imported and on_type.upper() == "DATABASE":
-                return f"GRANT IMPORTED PRIVILEGES ON DATABASE {on_name} TO ROLE {object_name};"
+                return (
+                    f"GRANT IMPORTED PRIVILEGES ON DATABASE {_object_name(on_name)} "
+                    f"TO ROLE {name};"
+                )
 
-            sql = f"GRANT {privilege} ON {on_type} {on_name} TO ROLE {object_name}"
+            sql = f"GRANT {privilege} ON {on_type} {_object_name(on_name)} TO ROLE {name}"
             if with_grant:
                 sql += " WITH GRANT OPTION"
             return sql + ";"
@@ -77,41 +166,30 @@ def _generate_snowflake_sql(
             privilege = details.get("privilege")
             on_type = details.get("on_type")
             on_name = details.get("on_name")
-            return f"REVOKE {privilege} ON {on_type} {on_name} FROM ROLE {object_name};"
+            return f"REVOKE {privilege} ON {on_type} {_object_name(on_name)} FROM ROLE {name};"
 
         case "create_user":
             login_name = details.get("login_name", object_name)
-            email = details.get("email", "")
             password = details.get("password", "")
-            first_name = details.get("first_name", "")
-            last_name = details.get("last_name", "")
-            display_name = details.get("display_name", "")
-            comment = details.get("comment", "")
-            default_namespace = details.get("default_namespace", "")
             must_change_password = details.get("must_change_password", True)
 
-            sql = f"CREATE USER IF NOT EXISTS {object_name}"
-            sql += f" LOGIN_NAME = '{login_name}'"
+            parts = [
+                f"CREATE USER IF NOT EXISTS {name}",
+                f"LOGIN_NAME = {quote_literal(login_name)}",
+            ]
             if password:
-                sql += f" PASSWORD = '{password}'"
+                parts.append(f"PASSWORD = {quote_literal(password)}")
                 if must_change_password:
-                    sql += " MUST_CHANGE_PASSWORD = TRUE"
-            if email:
-                sql += f" EMAIL = '{email}'"
-            if first_name:
-                sql += f" FIRST_NAME = '{first_name}'"
-            if last_name:
-                sql += f" LAST_NAME = '{last_name}'"
-            if display_name:
-                sql += f" DISPLAY_NAME = '{display_name}'"
-            if comment:
-                sql += f" COMMENT = '{comment}'"
-            if default_namespace:
-                sql += f" DEFAULT_NAMESPACE = '{default_namespace}'"
-            return sql + ";"
+                    parts.append("MUST_CHANGE_PASSWORD = TRUE")
+            parts.extend(
+                f"{sql_name} = {quote_literal(value)}"
+                for sql_name, key in _CREATE_USER_PROPERTIES
+                if (value := details.get(key, ""))
+            )
+            return " ".join(parts) + ";"
 
         case "drop_user":
-            return f"DROP USER IF EXISTS {object_name};"
+            return f"DROP USER IF EXISTS {name};"
 
         case "alter_user":
             alterations = []
@@ -120,9 +198,9 @@ def _generate_snowflake_sql(
                     "DISABLED = TRUE" if details["disabled"] else "DISABLED = FALSE"
                 )
             if "default_role" in details:
-                alterations.append(f"DEFAULT_ROLE = {details['default_role']}")
+                alterations.append(f"DEFAULT_ROLE = {_ident(details['default_role'])}")
             if alterations:
-                return f"ALTER USER {object_name} SET {' '.join(alterations)};"
+                return f"ALTER USER {name} SET {' '.join(alterations)};"
             return f"-- No changes for user {object_name}"
 
         case _:
@@ -136,21 +214,22 @@ def _generate_databricks_sql(
     details: dict[str, Any],
 ) -> str:
     """Generate Databricks-specific SQL (Unity Catalog)."""
+    principal = "`" + object_name.replace("`", "``") + "`"
     match change_type:
         case "create_group":
-            return f"-- CREATE GROUP not available via SQL in Databricks (use SCIM API)"
+            return "-- CREATE GROUP not available via SQL in Databricks (use SCIM API)"
 
         case "grant_privilege":
             privilege = details.get("privilege")
             on_type = details.get("on_type")
             on_name = details.get("on_name")
-            return f"GRANT {privilege} ON {on_type} {on_name} TO `{object_name}`;"
+            return f"GRANT {privilege} ON {on_type} {on_name} TO {principal};"
 
         case "revoke_privilege":
             privilege = details.get("privilege")
             on_type = details.get("on_type")
             on_name = details.get("on_name")
-            return f"REVOKE {privilege} ON {on_type} {on_name} FROM `{object_name}`;"
+            return f"REVOKE {privilege} ON {on_type} {on_name} FROM {principal};"
 
         case _:
             return f"-- Unsupported change type for Databricks: {change_type}"
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, AsyncIterator
 
 
 @dataclass
@@ -14,7 +14,7 @@ class SyncResult:
     errors: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatformUser:
     name: str
     email: str | None = None
@@ -24,7 +24,7 @@ class PlatformUser:
     platform_data: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatformRole:
     name: str
     description: str | None = None
@@ -33,7 +33,7 @@ class PlatformRole:
     platform_data: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class RoleAssignment:
     role_name: str
     assignee_type: str  # 'user' or 'role'
@@ -43,7 +43,7 @@ class RoleAssignment:
     platform_data: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatformGrant:
     privilege: str
     object_type: str
@@ -57,7 +57,7 @@ class PlatformGrant:
     platform_data: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatformDatabase:
     name: str
     owner: str | None = None
@@ -66,7 +66,7 @@ class PlatformDatabase:
     platform_data: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatformSchema:
     name: str
     database_name: str
@@ -100,8 +100,8 @@ class PlatformConnector(ABC):
         pass
 
     @abstractmethod
-    async def sync_grants(self) -> list[PlatformGrant]:
-        """Fetch all grants/permissions."""
+    def sync_grants(self) -> AsyncIterator[list[PlatformGrant]]:
+        """Fetch all grants/permissions, yielded in batches (e.g. per role)."""
         pass
 
     @abstractmethod
@@ -1,7 +1,7 @@
 from typing import Any
 
 from .base import PlatformConnector
-from .snowflake import SnowflakeConnector
+from .snowflake import SnowflakeConnector, load_private_key
 
 
 def get_connector(
@@ -15,8 +15,9 @@ def get_connector(
         return SnowflakeConnector(
             account=connection_config["account_identifier"],
             user=credentials["user"],
-            private_key=credentials["private_key"],
+            private_key=load_private_key(credentials["private_key"]),
             warehouse=connection_config.get("warehouse"),
+            grants_source=connection_config.get("grants_source", "show"),
         )
 
     elif platform == "databricks":
@@ -1,26 +1,27 @@
+import asyncio
+import contextlib
 import json
 from datetime import datetime
+from typing import AsyncIterator
 from uuid import UUID
 
-import boto3
-from sqlalchemy import select, func
+from sqlalchemy import and_, case, delete, func, not_, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
-from src.config import get_settings
 from src.models.database import (
     Connection,
     PlatformGrant,
     PlatformRole,
     PlatformUser,
     RoleAssignment,
-    SessionLocal,
     SyncRun,
+    get_session_local,
 )
+from src.services.aws import get_parameter
 
 from .factory import get_connector
 
-settings = get_settings()
-
 # Sync step definitions
 SYNC_STEPS = [
     {"number": 1, "name": "Connecting", "description": "Establishing connection to platform"},
@@ -34,13 +35,15 @@ SYNC_STEPS = [
 ]
 
 
+# Grant batches (one per role) buffered ahead of step 5. The grants fetch runs
+# concurrently with the earlier steps, so this bounds what it can hold in memory.
+_GRANT_BATCHES_AHEAD = 100
+
+
 def get_credentials_from_param_store(param_path: str) -> dict:
     """Retrieve credentials from AWS Parameter Store."""
-    ssm = boto3.client("ssm", region_name=settings.aws_region)
-
     try:
-        response = ssm.get_parameter(Name=param_path, WithDecryption=True)
-        return json.loads(response["Parameter"]["Value"])
+        return json.loads(get_parameter(param_path))
     except Exception as e:
         raise ValueError(f"Failed to retrieve credentials: {e}")
 
@@ -53,113 +56,159 @@ def _update_sync_progress(db: Session, sync_run: SyncRun, step_number: int, step
     db.commit()
 
 
-def _infer_role_type(
-    has_data_grants: bool,
-    user_assignment_count: int,
-    parent_role_count: int,
-) -> str:
-    """
-    Infer role type based on configuration patterns.
-    Returns 'functional', 'business', or 'hybrid'.
-    """
-    # Functional: Has direct DB/schema/table grants, no user assignments
-    is_functional_pattern = has_data_grants and user_assignment_count == 0
-
-    # Business: Inherits from roles, assigned to users, no direct data grants
-    is_business_pattern = parent_role_count > 0 and user_assignment_count > 0 and not has_data_grants
-
-    if is_functional_pattern and not is_business_pattern:
-        return "functional"
-    elif is_business_pattern and not is_functional_pattern:
-        return "business"
-    elif has_data_grants and (user_assignment_count > 0 or parent_role_count > 0):
-        return "hybrid"
-    else:
-        # Default to business if no clear pattern (no grants, just a container role)
-        return "business"
+# Object types whose grants count as data access when inferring role types
+_DATA_GRANT_TYPES = ("DATABASE", "SCHEMA", "TABLE", "VIEW")
 
 
 def _calculate_role_types(db: Session, connection_id: UUID):
-    """Calculate and update role types for all roles in a connection."""
-    # Get all roles
-    roles = db.execute(
-        select(PlatformRole).where(PlatformRole.connection_id == connection_id)
-    ).scalars().all()
-
-    # Get all assignments
-    assignments = db.execute(
-        select(RoleAssignment).where(RoleAssignment.connection_id == connection_id)
-    ).scalars().all()
-
-    # Get all grants
-    grants = db.execute(
-        select(PlatformGrant).where(
+    """Calculate and update role types for all roles in a connection.
+
+    Role names are matched case-insensitively. Per role:
+    - functional: has direct DB/schema/table/view grants, no user assignments
+    - business: inherits from roles and is assigned to users, without direct
+      data grants; also the default when there is no clear pattern (e.g. a
+      container role with no grants)
+    - hybrid: has data grants as well as user assignments or parent roles
+
+    The counts are aggregated in the database and all roles are updated with
+    one UPDATE, instead of loading every role, assignment and grant.
+    """
+    # User assignments per role
+    user_assignments = (
+        select(
+            func.upper(RoleAssignment.role_name).label("role_name"),
+            func.count().label("count"),
+        )
+        .where(
+            RoleAssignment.connection_id == connection_id,
+            func.upper(RoleAssignment.assignee_type) == "USER",
+        )
+        .group_by(func.upper(RoleAssignment.role_name))
+        .subquery()
+    )
+    # Parent roles per role: a role granted TO assignee_name is inherited by it
+    parent_roles = (
+        select(
+            func.upper(RoleAssignment.assignee_name).label("role_name"),
+            func.count().label("count"),
+        )
+        .where(
+            RoleAssignment.connection_id == connection_id,
+            func.upper(RoleAssignment.assignee_type) == "ROLE",
+        )
+        .group_by(func.upper(RoleAssignment.assignee_name))
+        .subquery()
+    )
+    # Roles with data grants
+    data_grants = (
+        select(func.upper(PlatformGrant.grantee_name).label("role_name"))
+        .where(
             PlatformGrant.connection_id == connection_id,
             PlatformGrant.grantee_type == "ROLE",
+            func.upper(PlatformGrant.object_type).in_(_DATA_GRANT_TYPES),
         )
-    ).scalars().all()
-
-    # Build lookup structures
-    # Count user assignments per role
-    user_assignments_per_role: dict[str, int] = {}
-    # Count parent roles per role (roles that grant TO this role)
-    parent_roles_per_role: dict[str, int] = {}
-
-    for assignment in assignments:
-        role_name_upper = assignment.role_name.upper()
-        if assignment.assignee_type.upper() == "USER":
-            user_assignments_per_role[role_name_upper] = (
-                user_assignments_per_role.get(role_name_upper, 0) + 1
-            )
-        elif assignment.assignee_type.upper() == "ROLE":
-            # This role is granted TO assignee_name, so assignee_name inherits from role_name
-            assignee_upper = assignment.assignee_name.upper()
-            parent_roles_per_role[assignee_upper] = (
-                parent_roles_per_role.get(assignee_upper, 0) + 1
-            )
-
-    # Check which roles have data grants (DB/schema/table/view grants)
-    data_grant_types = {"DATABASE", "SCHEMA", "TABLE", "VIEW"}
-    roles_with_data_grants: set[str] = set()
-
-    for grant in grants:
-        obj_type = grant.object_type.upper() if grant.object_type else ""
-        if obj_type in data_grant_types:
-            roles_with_data_grants.add(grant.grantee_name.upper())
-
-    # Update each role's type
-    for role in roles:
-        role_name_upper = role.name.upper()
-        has_data_grants = role_name_upper in roles_with_data_grants
-        user_assignment_count = user_assignments_per_role.get(role_name_upper, 0)
-        parent_role_count = parent_roles_per_role.get(role_name_upper, 0)
-
-        role.role_type = _infer_role_type(
-            has_data_grants=has_data_grants,
-            user_assignment_count=user_assignment_count,
-            parent_role_count=parent_role_count,
+        .distinct()
+        .subquery()
+    )
+
+    role_name = func.upper(PlatformRole.name)
+    stats = (
+        select(
+            PlatformRole.id,
+            func.coalesce(user_assignments.c.count, 0).label("users"),
+            func.coalesce(parent_roles.c.count, 0).label("parents"),
+            (data_grants.c.role_name.is_not(None)).label("has_data_grants"),
+        )
+        .outerjoin(user_assignments, user_assignments.c.role_name == role_name)
+        .outerjoin(parent_roles, parent_roles.c.role_name == role_name)
+        .outerjoin(data_grants, data_grants.c.role_name == role_name)
+        .where(PlatformRole.connection_id == connection_id)
+        .subquery()
+    )
+
+    is_functional = and_(stats.c.has_data_grants, stats.c.users == 0)
+    is_business = and_(
+        stats.c.parents > 0, stats.c.users > 0, not_(stats.c.has_data_grants)
+    )
+    role_type = case(
+        (is_functional, "functional"),
+        (is_business, "business"),
+        (and_(stats.c.has_data_grants, or_(stats.c.users > 0, stats.c.parents > 0)), "hybrid"),
+        else_="business",
+    )
+
+    # Only roles whose type changed are written
+    db.execute(
+        update(PlatformRole)
+        .where(
+            PlatformRole.id == stats.c.id,
+            PlatformRole.role_type.is_distinct_from(role_type),
         )
+        .values(role_type=role_type)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def _read_ahead(batches: AsyncIterator[list], queue: asyncio.Queue) -> None:
+    """Put each batch on the queue, then None at the end.
+
+    A failed fetch puts its exception instead, for the consumer to raise. If
+    the task is cancelled, the batches generator is closed before it ends, so
+    the generator can wait for the queries it has running.
+    """
+    try:
+        async with contextlib.aclosing(batches):
+            async for batch in batches:
+                await queue.put(batch)
+    except Exception as e:
+        await queue.put(e)
+    else:
+        await queue.put(None)
+
+
+def _load_sync_run(
+    db: Session, sync_run_id: UUID, connection_id: UUID
+) -> tuple[SyncRun, Connection]:
+    sync_run = db.execute(select(SyncRun).where(SyncRun.id == sync_run_id)).scalar_one()
+    connection = db.execute(
+        select(Connection).where(Connection.id == connection_id)
+    ).scalar_one()
+    return sync_run, connection
 
 
 async def run_sync(sync_run_id: str, connection_id: str):
     """Run a full sync for a connection."""
-    db = SessionLocal()
+    # Database and SSM calls block, so they run in worker threads to keep the
+    # event loop free while the platform fetches are in flight. Each session is
+    # still used by one thread at a time.
+    #
+    # The synced data is written in one transaction on db and committed at the
+    # end, so readers never see a half-synced connection and a failed sync
+    # leaves the previous data in place. The sync run and connection status
+    # live in progress_db, which commits each step for the progress endpoint.
+    # The two sessions write to different tables, so they never wait on each
+    # other's row locks.
+    session_local = get_session_local()
+    if session_local is None:
+        raise RuntimeError("Database not configured. Set DATABASE_URL environment variable.")
+    db = session_local()
+    progress_db = session_local()
 
     try:
         # Get sync run and connection
-        sync_run = db.execute(
-            select(SyncRun).where(SyncRun.id == UUID(sync_run_id))
-        ).scalar_one()
-
-        connection = db.execute(
-            select(Connection).where(Connection.id == UUID(connection_id))
-        ).scalar_one()
+        sync_run, connection = await asyncio.to_thread(
+            _load_sync_run, progress_db, UUID(sync_run_id), UUID(connection_id)
+        )
 
         # Step 1: Connecting
-        _update_sync_progress(db, sync_run, 1, "Connecting")
+        await asyncio.to_thread(
+            _update_sync_progress, progress_db, sync_run, 1, "Connecting"
+        )
 
         # Get credentials
-        credentials = get_credentials_from_param_store(connection.credential_param_path)
+        credentials = await asyncio.to_thread(
+            get_credentials_from_param_store, connection.credential_param_path
+        )
 
         # Create connector
         connector = get_connector(
@@ -168,61 +217,102 @@ async def run_sync(sync_run_id: str, connection_id: str):
             credentials=credentials,
         )
 
+        # The platform fetches are independent of each other, so they all
+        # start now and run concurrently. Each step below waits for its own
+        # result, so the progress still moves through the steps in order.
+        users_fetch = asyncio.ensure_future(connector.sync_users())
+        roles_fetch = asyncio.ensure_future(connector.sync_roles())
+        assignments_fetch = asyncio.ensure_future(connector.sync_role_assignments())
+        grant_batches: asyncio.Queue = asyncio.Queue(maxsize=_GRANT_BATCHES_AHEAD)
+        grants_fetch = asyncio.ensure_future(
+            _read_ahead(connector.sync_grants(), grant_batches)
+        )
+        databases_fetch = asyncio.ensure_future(connector.sync_databases())
+        schemas_fetch = asyncio.ensure_future(connector.sync_schemas())
+        fetches = (
+            users_fetch,
+            roles_fetch,
+            assignments_fetch,
+            grants_fetch,
+            databases_fetch,
+            schemas_fetch,
+        )
+
         try:
             # Step 2: Sync users
-            _update_sync_progress(db, sync_run, 2, "Syncing users")
-            users = await connector.sync_users()
-            _upsert_users(db, UUID(connection_id), users)
+            await asyncio.to_thread(
+                _update_sync_progress, progress_db, sync_run, 2, "Syncing users"
+            )
+            users = await users_fetch
+            await asyncio.to_thread(upsert_users, db, UUID(connection_id), users)
             sync_run.users_synced = len(users)
-            db.commit()
 
             # Step 3: Sync roles
-            _update_sync_progress(db, sync_run, 3, "Syncing roles")
-            roles = await connector.sync_roles()
-            _upsert_roles(db, UUID(connection_id), roles)
+            await asyncio.to_thread(
+                _update_sync_progress, progress_db, sync_run, 3, "Syncing roles"
+            )
+            roles = await roles_fetch
+            await asyncio.to_thread(upsert_roles, db, UUID(connection_id), roles)
             sync_run.roles_synced = len(roles)
-            db.commit()
 
             # Step 4: Sync role assignments
-            _update_sync_progress(db, sync_run, 4, "Syncing role assignments")
-            assignments = await connector.sync_role_assignments()
-            _upsert_role_assignments(db, UUID(connection_id), assignments)
-            db.commit()
+            await asyncio.to_thread(
+                _update_sync_progress, progress_db, sync_run, 4, "Syncing role assignments"
+            )
+            assignments = await assignments_fetch
+            await asyncio.to_thread(
+                upsert_role_assignments, db, UUID(connection_id), assignments
+            )
 
             # Step 5: Sync grants
-            _update_sync_progress(db, sync_run, 5, "Syncing grants")
-            grants = await connector.sync_grants()
-            _upsert_grants(db, UUID(connection_id), grants)
-            sync_run.grants_synced = len(grants)
-            db.commit()
+            await asyncio.to_thread(
+                _update_sync_progress, progress_db, sync_run, 5, "Syncing grants"
+            )
+            # Grants are replaced, a batch at a time as they arrive
+            await asyncio.to_thread(delete_grants, db, UUID(connection_id))
+            sync_run.grants_synced = 0
+            while (grants := await grant_batches.get()) is not None:
+                if isinstance(grants, Exception):
+                    raise grants
+                await asyncio.to_thread(insert_grants, db, UUID(connection_id), grants)
+                sync_run.grants_synced += len(grants)
 
             # Step 6: Sync databases
-            _update_sync_progress(db, sync_run, 6, "Syncing databases")
-            databases = await connector.sync_databases()
+            await asyncio.to_thread(
+                _update_sync_progress, progress_db, sync_run, 6, "Syncing databases"
+            )
+            databases = await databases_fetch
             sync_run.databases_synced = len(databases)
-            db.commit()
 
             # Step 7: Sync schemas
-            _update_sync_progress(db, sync_run, 7, "Syncing schemas")
-            schemas = await connector.sync_schemas()
+            await asyncio.to_thread(
+                _update_sync_progress, progress_db, sync_run, 7, "Syncing schemas"
+            )
+            schemas = await schemas_fetch
             sync_run.schemas_synced = len(schemas)
-            db.commit()
 
             # Step 8: Calculate role types
-            _update_sync_progress(db, sync_run, 8, "Calculating role types")
-            _calculate_role_types(db, UUID(connection_id))
-            db.commit()
+            await asyncio.to_thread(
+                _update_sync_progress, progress_db, sync_run, 8, "Calculating role types"
+            )
+            await asyncio.to_thread(_calculate_role_types, db, UUID(connection_id))
+
+            # All synced data becomes visible at once
+            await asyncio.to_thread(db.commit)
 
             # Update sync status
             sync_run.status = "completed"
-            sync_run.completed_at = datetime.utcnow()
+            completed_at = datetime.utcnow()
+            sync_run.completed_at = completed_at
             sync_run.current_step = "Completed"
 
-            connection.last_sync_at = datetime.utcnow()
+            connection.last_sync_at = completed_at
             connection.last_sync_status = "success"
             connection.last_sync_error = None
 
         except Exception as e:
+            await asyncio.to_thread(db.rollback)
+
             sync_run.status = "failed"
             sync_run.error_message = str(e)
             sync_run.completed_at = datetime.utcnow()
@@ -231,124 +321,155 @@ async def run_sync(sync_run_id: str, connection_id: str):
             connection.last_sync_error = str(e)
 
         finally:
+            # A failed step leaves later fetches running; let them finish
+            # before the connection they share is closed. The grants fetch
+            # may be waiting for step 5 to take its batches, so it is stopped;
+            # stopping it closes the grants generator, which waits for the
+            # grants queries already running in worker threads (they can't be
+            # interrupted) before the task ends.
+            grants_fetch.cancel()
+            await asyncio.gather(*fetches, return_exceptions=True)
             if hasattr(connector, "close"):
                 connector.close()
 
-        db.commit()
+        await asyncio.to_thread(progress_db.commit)
 
     except Exception as e:
         db.rollback()
+        progress_db.rollback()
         raise
     finally:
         db.close()
+        progress_db.close()
 
 
-def _upsert_users(db: Session, connection_id: UUID, users: list):
-    """Upsert platform users."""
-    for user in users:
-        existing = db.execute(
-            select(PlatformUser).where(
-                PlatformUser.connection_id == connection_id,
-                PlatformUser.name == user.name,
-            )
-        ).scalar_one_or_none()
-
-        if existing:
-            existing.email = user.email
-            existing.display_name = user.display_name
-            existing.disabled = user.disabled
-            existing.platform_data = user.platform_data
-            existing.synced_at = datetime.utcnow()
-        else:
-            db.add(
-                PlatformUser(
-                    connection_id=connection_id,
-                    name=user.name,
-                    email=user.email,
-                    display_name=user.display_name,
-                    disabled=user.disabled,
-                    created_on=user.created_on,
-                    platform_data=user.platform_data,
-                )
-            )
-
+def _upsert(
+    db: Session,
+    model,
+    rows: list[dict],
+    key: tuple[str, ...],
+    update: tuple[str, ...],
+):
+    """Insert rows, or update the given columns of rows that already exist.
 
-def _upsert_roles(db: Session, connection_id: UUID, roles: list):
+    One INSERT ... ON CONFLICT (key) DO UPDATE, executed for all rows in
+    batched multi-row VALUES. Rows with the same key are collapsed to the last
+    one, since a single statement can't update a row twice.
+    """
+    if not rows:
+        return
+    rows = list({tuple(row[k] for k in key): row for row in rows}.values())
+    stmt = insert(model)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(key),
+        set_={column: stmt.excluded[column] for column in (*update, "synced_at")},
+    )
+    db.execute(stmt, rows)
+
+
+def upsert_users(db: Session, connection_id: UUID, users: list):
+    """Upsert platform users."""
+    synced_at = datetime.utcnow()
+    _upsert(
+        db,
+        PlatformUser,
+        [
+            {
+                "connection_id": connection_id,
+                "name": user.name,
+                "email": user.email,
+                "display_name": user.display_name,
+                "disabled": user.disabled,
+                "created_on": user.created_on,
+                "platform_data": user.platform_data,
+                "synced_at": synced_at,
+            }
+            for user in users
+        ],
+        key=("connection_id", "name"),
+        update=("email", "display_name", "disabled", "platform_data"),
+    )
+
+
+def upsert_roles(db: Session, connection_id: UUID, roles: list):
     """Upsert platform roles."""
-    for role in roles:
-        existing = db.execute(
-            select(PlatformRole).where(
-                PlatformRole.connection_id == connection_id,
-                PlatformRole.name == role.name,
-            )
-        ).scalar_one_or_none()
-
-        if existing:
-            existing.description = role.description
-            existing.is_system = role.is_system
-            existing.platform_data = role.platform_data
-            existing.synced_at = datetime.utcnow()
-        else:
-            db.add(
-                PlatformRole(
-                    connection_id=connection_id,
-                    name=role.name,
-                    description=role.description,
-                    is_system=role.is_system,
-                    created_on=role.created_on,
-                    platform_data=role.platform_data,
-                )
-            )
-
-
-def _upsert_role_assignments(db: Session, connection_id: UUID, assignments: list):
+    synced_at = datetime.utcnow()
+    _upsert(
+        db,
+        PlatformRole,
+        [
+            {
+                "connection_id": connection_id,
+                "name": role.name,
+                "description": role.description,
+                "is_system": role.is_system,
+                "created_on": role.created_on,
+                "platform_data": role.platform_data,
+                "synced_at": synced_at,
+            }
+            for role in roles
+        ],
+        key=("connection_id", "name"),
+        update=("description", "is_system", "platform_data"),
+    )
+
+
+def upsert_role_assignments(db: Session, connection_id: UUID, assignments: list):
     """Upsert role assignments."""
-    for assignment in assignments:
-        existing = db.execute(
-            select(RoleAssignment).where(
-                RoleAssignment.connection_id == connection_id,
-                RoleAssignment.role_name == assignment.role_name,
-                RoleAssignment.assignee_type == assignment.assignee_type,
-                RoleAssignment.assignee_name == assignment.assignee_name,
-            )
-        ).scalar_one_or_none()
-
-        if existing:
-            existing.assigned_by = assignment.assigned_by
-            existing.platform_data = assignment.platform_data
-            existing.synced_at = datetime.utcnow()
-        else:
-            db.add(
-                RoleAssignment(
-                    connection_id=connection_id,
-                    role_name=assignment.role_name,
-                    assignee_type=assignment.assignee_type,
-                    assignee_name=assignment.assignee_name,
-                    assigned_by=assignment.assigned_by,
-                    created_on=assignment.created_on,
-                    platform_data=assignment.platform_data,
-                )
-            )
-
-
-def _upsert_grants(db: Session, connection_id: UUID, grants: list):
-    """Upsert platform grants."""
-    # For grants, we typically do a full replace since the set can change significantly
-    # First, mark old grants for deletion (or you could soft-delete)
-    # For simplicity, we'll just add new grants without duplicating
-
-    for grant in grants:
-        # Check for existing grant (simplified - in production you'd want a unique constraint)
-        db.add(
-            PlatformGrant(
-                connection_id=connection_id,
-                privilege=grant.privilege,
-                object_type=grant.object_type,
-                object_name=grant.object_name,
-                grantee_type=grant.grantee_type,
-                grantee_name=grant.grantee_name,
-                with_grant_option=grant.with_grant_option,
-                granted_by=grant.granted_by,
-                platform_data=grant.platform_data,
-            )
-        )
+    synced_at = datetime.utcnow()
+    _upsert(
+        db,
+        RoleAssignment,
+        [
+            {
+                "connection_id": connection_id,
+                "role_name": assignment.role_name,
+                "assignee_type": assignment.assignee_type,
+                "assignee_name": assignment.assignee_name,
+                "assigned_by": assignment.assigned_by,
+                "created_on": assignment.created_on,
+                "platform_data": assignment.platform_data,
+                "synced_at": synced_at,
+            }
+            for assignment in assignments
+        ],
+        key=("connection_id", "role_name", "assignee_type", "assignee_name"),
+        update=("assigned_by", "platform_data"),
+    )
+
+
+def delete_grants(db: Session, connection_id: UUID):
+    """Delete the platform grants of a connection, before a sync inserts the
+    new set.
+
+    Grants have no natural key to upsert on and the set can change
+    significantly between syncs, so they are replaced. The delete and the
+    inserts happen in the sync's transaction, so readers see the old set until
+    the commit.
+    """
+    db.execute(delete(PlatformGrant).where(PlatformGrant.connection_id == connection_id))
+
+
+def insert_grants(db: Session, connection_id: UUID, grants: list):
+    """Insert a batch of platform grants in batched multi-row VALUES."""
+    if not grants:
+        return
+    db.execute(
+        insert(PlatformGrant),
+        [
+            {
+                "connection_id": connection_id,
+                "privilege": grant.privilege,
+                "object_type": grant.object_type,
+                "object_name": grant.object_name,
+                "object_database": grant.object_database,
+                "object_schema": grant.object_schema,
+                "grantee_type": grant.grantee_type,
+                "grantee_name": grant.grantee_name,
+                "with_grant_option": grant.with_grant_option,
+                "granted_by": grant.granted_by,
+                "platform_data": grant.platform_data,
+            }
+            for grant in grants
+        ],
+    )
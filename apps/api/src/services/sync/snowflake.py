@@ -1,4 +1,12 @@
+import asyncio
+import functools
+import threading
+from collections import deque
+from typing import AsyncIterator
+
 import snowflake.connector
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
 from snowflake.connector import DictCursor
 
 from .base import (
@@ -12,6 +20,93 @@ from .base import (
 )
 
 
+def load_private_key(private_key_pem: str) -> bytes:
+    """Parse a PEM-encoded private key into the DER bytes Snowflake expects.
+
+    Not cached: the key is only kept for the connector that needs it.
+    """
+    private_key = serialization.load_pem_private_key(
+        private_key_pem.strip().encode("utf-8"),
+        password=None,
+        backend=default_backend(),
+    )
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+
+def _in_thread(fetch):
+    """Run a blocking fetch in a worker thread.
+
+    The Snowflake connector is synchronous, so this keeps the event loop free
+    and lets several fetches of one sync run at the same time. Each fetch uses
+    its own cursor on the shared connection.
+    """
+    @functools.wraps(fetch)
+    async def wrapper(self, *args, **kwargs):
+        return await asyncio.to_thread(fetch, self, *args, **kwargs)
+
+    return wrapper
+
+
+def _quoted(name: str) -> str:
+    """Quote a role or database name as returned by a SHOW command.
+
+    Names from SHOW output are exact, so they are always double-quoted; bare,
+    Snowflake would upper-case them, and names with special characters
+    wouldn't parse.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+# SHOW commands return at most this many rows
+_SHOW_MAX_ROWS = 10_000
+
+# Per-role and per-database SHOW queries in flight at once for one sync. Each
+# runs on its own cursor of the shared connection, in a worker thread.
+_QUERIES_IN_FLIGHT = 8
+
+
+def _start_bounded(fetch, items) -> list[asyncio.Future]:
+    """Start a blocking fetch per item, at most _QUERIES_IN_FLIGHT at a time.
+
+    The returned futures are in the order of the items.
+    """
+    semaphore = asyncio.Semaphore(_QUERIES_IN_FLIGHT)
+
+    async def run(item):
+        async with semaphore:
+            return await asyncio.to_thread(fetch, item)
+
+    return [asyncio.ensure_future(run(item)) for item in items]
+
+
+# Parts of a fully qualified name (DB.SCHEMA.OBJECT) per granted object type;
+# types not listed are account-level and named by a single identifier
+_OBJECT_NAME_PARTS = {
+    "DATABASE": 1,
+    "SCHEMA": 2,
+    **dict.fromkeys(
+        (
+            "TABLE", "VIEW", "STAGE", "FILE_FORMAT", "SEQUENCE", "STREAM", "TASK",
+            "PROCEDURE", "FUNCTION",
+        ),
+        3,
+    ),
+}
+
+# Current privilege grants to account roles, for grants_source "account_usage"
+_ACCOUNT_USAGE_GRANTS_SQL = """
+    SELECT GRANTEE_NAME, PRIVILEGE, GRANTED_ON, NAME, TABLE_CATALOG,
+           TABLE_SCHEMA, GRANT_OPTION, GRANTED_BY
+    FROM SNOWFLAKE.ACCOUNT_USAGE.GRANTS_TO_ROLES
+    WHERE DELETED_ON IS NULL AND GRANTED_TO = 'ROLE'
+    ORDER BY GRANTEE_NAME
+"""
+
+
 class SnowflakeConnector(PlatformConnector):
     """Snowflake-specific implementation."""
 
@@ -28,34 +123,62 @@ class SnowflakeConnector(PlatformConnector):
         self,
         account: str,
         user: str,
-        private_key: str,
+        private_key: bytes,
         warehouse: str | None = None,
         role: str = "GRANTD_READONLY",
+        grants_source: str = "show",
     ):
         self.account = account
         self.user = user
         self.private_key = private_key
         self.warehouse = warehouse
         self.role = role
+        self.grants_source = grants_source
         self._conn = None
+        self._conn_lock = threading.Lock()
+        # SHOW ROLES / SHOW DATABASES rows, shared by the fetches of one sync
+        self._shown: dict[str, list[dict]] = {}
+        self._show_locks: dict[str, threading.Lock] = {}
 
     def _get_connection(self):
-        if self._conn is None:
-            self._conn = snowflake.connector.connect(
-                account=self.account,
-                user=self.user,
-                private_key=self.private_key,
-                warehouse=self.warehouse,
-                role=self.role,
-            )
-        return self._conn
+        # Fetches run in worker threads, so only one of them may connect
+        with self._conn_lock:
+            if self._conn is None:
+                self._conn = snowflake.connector.connect(
+                    account=self.account,
+                    user=self.user,
+                    private_key=self.private_key,
+                    warehouse=self.warehouse,
+                    role=self.role,
+                )
+            return self._conn
+
+    def _show(self, command: str) -> list[dict]:
+        """Run a SHOW command once per connector and return its rows.
+
+        Several fetches of a sync need the list of roles or databases, and they
+        run at the same time, so the first one runs the query while the others
+        wait for its rows.
+        """
+        with self._conn_lock:
+            lock = self._show_locks.setdefault(command, threading.Lock())
+        with lock:
+            if command not in self._shown:
+                cursor = self._get_connection().cursor(DictCursor)
+                try:
+                    cursor.execute(command)
+                    self._shown[command] = cursor.fetchall()
+                finally:
+                    cursor.close()
+            return self._shown[command]
 
     def close(self):
         if self._conn:
             self._conn.close()
             self._conn = None
 
-    async def test_connection(self) -> dict:
+    @_in_thread
+    def test_connection(self) -> dict:
         """Test the connection and return details about the connected session."""
         try:
             conn = self._get_connection()
@@ -111,13 +234,14 @@ class SnowflakeConnector(PlatformConnector):
                     "message": f"Connection failed: {error_msg}",
                 }
 
-    async def sync_users(self) -> list[PlatformUser]:
+    @_in_thread
+    def sync_users(self) -> list[PlatformUser]:
         conn = self._get_connection()
         cursor = conn.cursor(DictCursor)
         cursor.execute("SHOW USERS")
 
         users = []
-        for row in cursor.fetchall():
+        for row in cursor:
             users.append(
                 PlatformUser(
                     name=row["name"],
@@ -137,13 +261,10 @@ class SnowflakeConnector(PlatformConnector):
         cursor.close()
         return users
 
-    async def sync_roles(self) -> list[PlatformRole]:
-        conn = self._get_connection()
-        cursor = conn.cursor(DictCursor)
-        cursor.execute("SHOW ROLES")
-
+    @_in_thread
+    def sync_roles(self) -> list[PlatformRole]:
         roles = []
-        for row in cursor.fetchall():
+        for row in self._show("SHOW ROLES"):
             name = row["name"]
             roles.append(
                 PlatformRole(
@@ -158,38 +279,34 @@ class SnowflakeConnector(PlatformConnector):
                     },
                 )
             )
-        cursor.close()
         return roles
 
     async def sync_role_assignments(self) -> list[RoleAssignment]:
-        conn = self._get_connection()
-        cursor = conn.cursor(DictCursor)
+        """Fetch the grants of every role, querying several roles at a time."""
+        roles = await asyncio.to_thread(self._role_names)
+        batches = await asyncio.gather(*_start_bounded(self._grants_of_role, roles))
+        return [assignment for batch in batches for assignment in batch]
 
+    def _grants_of_role(self, role: str) -> list[RoleAssignment]:
+        cursor = self._get_connection().cursor(DictCursor)
         assignments = []
-
-        # Get all roles first
-        cursor.execute("SHOW ROLES")
-        roles = [row["name"] for row in cursor.fetchall()]
-
-        # For each role, get grants
-        for role in roles:
-            try:
-                cursor.execute(f"SHOW GRANTS OF ROLE {role}")
-                for row in cursor.fetchall():
-                    assignments.append(
-                        RoleAssignment(
-                            role_name=role,
-                            assignee_type=row.get("granted_to", "").upper(),
-                            assignee_name=row.get("grantee_name", ""),
-                            assigned_by=row.get("granted_by"),
-                            created_on=str(row.get("created_on")) if row.get("created_on") else None,
-                        )
+        try:
+            cursor.execute(f"SHOW GRANTS OF ROLE {_quoted(role)}")
+            for row in cursor:
+                assignments.append(
+                    RoleAssignment(
+                        role_name=role,
+                        assignee_type=row.get("granted_to", "").upper(),
+                        assignee_name=row.get("grantee_name", ""),
+                        assigned_by=row.get("granted_by"),
+                        created_on=str(row.get("created_on")) if row.get("created_on") else None,
                     )
-            except Exception:
-                # Skip roles we can't query
-                pass
-
-        cursor.close()
+                )
+        except Exception:
+            # Skip roles we can't query
+            pass
+        finally:
+            cursor.close()
         return assignments
 
     def _parse_object_name(self, full_name: str | None, object_type: str) -> tuple[str | None, str | None, str | None]:
@@ -204,70 +321,143 @@ class SnowflakeConnector(PlatformConnector):
         if not full_name:
             return None, None, None
 
-        parts = full_name.split(".")
-        obj_type_upper = object_type.upper()
+        # Account-level objects like WAREHOUSE, ROLE, USER, etc.
+        name_parts = _OBJECT_NAME_PARTS.get(object_type.upper())
+        if name_parts is None:
+            return None, None, full_name
 
-        if obj_type_upper == "DATABASE":
-            return parts[0] if parts else None, None, parts[0] if parts else None
-        elif obj_type_upper == "SCHEMA":
+        parts = full_name.split(".")
+        if name_parts == 1:
+            return parts[0], None, parts[0]
+        elif name_parts == 2:
             if len(parts) >= 2:
                 return parts[0], parts[1], parts[1]
-            return None, parts[0] if parts else None, parts[0] if parts else None
-        elif obj_type_upper in ("TABLE", "VIEW", "STAGE", "FILE_FORMAT", "SEQUENCE", "STREAM", "TASK", "PROCEDURE", "FUNCTION"):
+            return None, parts[0], parts[0]
+        else:
             if len(parts) >= 3:
                 return parts[0], parts[1], parts[2]
             elif len(parts) == 2:
                 return None, parts[0], parts[1]
-            return None, None, parts[0] if parts else None
-        else:
-            # For account-level objects like WAREHOUSE, ROLE, USER, etc.
-            return None, None, full_name
-
-    async def sync_grants(self) -> list[PlatformGrant]:
-        conn = self._get_connection()
-        cursor = conn.cursor(DictCursor)
+            return None, None, parts[0]
+
+    async def sync_grants(self) -> AsyncIterator[list[PlatformGrant]]:
+        """Yield the grants of each role as a batch.
+
+        A sync stores each batch as it arrives instead of holding every grant
+        of the account at once. Up to _QUERIES_IN_FLIGHT roles are queried at a
+        time, and the batches are yielded in role order. Another role is only
+        queried once the oldest batch has been taken, so a slow consumer holds
+        back the queries instead of piling up their results.
+
+        With grants_source "account_usage", all grants are read with a single
+        query on SNOWFLAKE.ACCOUNT_USAGE.GRANTS_TO_ROLES instead of one SHOW
+        GRANTS per role. That view lags behind by up to a few hours and needs
+        IMPORTED PRIVILEGES on the SNOWFLAKE database, so it's opt-in for
+        accounts with many roles.
+        """
+        if self.grants_source == "account_usage":
+            for grants in await asyncio.to_thread(self._account_usage_grants):
+                yield grants
+            return
+
+        roles = iter(await asyncio.to_thread(self._role_names))
+        fetches: deque[asyncio.Future] = deque()
+
+        def start_next() -> None:
+            role = next(roles, None)
+            if role is not None:
+                fetches.append(
+                    asyncio.ensure_future(asyncio.to_thread(self._grants_to_role, role))
+                )
 
+        for _ in range(_QUERIES_IN_FLIGHT):
+            start_next()
+        try:
+            while fetches:
+                # Shielded, so that if the sync is stopped here the query keeps
+                # its future and can still be waited for below
+                grants = await asyncio.shield(fetches[0])
+                fetches.popleft()
+                if grants:
+                    yield grants
+                start_next()
+        finally:
+            # A query in a worker thread can't be interrupted. Wait for the
+            # running ones, so the connection isn't closed under them.
+            await asyncio.gather(*fetches, return_exceptions=True)
+
+    def _role_names(self) -> list[str]:
+        return [row["name"] for row in self._show("SHOW ROLES")]
+
+    def _grants_to_role(self, role: str) -> list[PlatformGrant]:
+        cursor = self._get_connection().cursor(DictCursor)
         grants = []
-
-        # Get all roles
-        cursor.execute("SHOW ROLES")
-        roles = [row["name"] for row in cursor.fetchall()]
-
-        # For each role, get privileges
-        for role in roles:
-            try:
-                cursor.execute(f"SHOW GRANTS TO ROLE {role}")
-                for row in cursor.fetchall():
-                    full_name = row.get("name")
-                    object_type = row.get("granted_on", "")
-                    db_name, schema_name, obj_name = self._parse_object_name(full_name, object_type)
-
-                    grants.append(
-                        PlatformGrant(
-                            privilege=row.get("privilege", ""),
-                            object_type=object_type,
-                            object_name=obj_name,
-                            object_database=db_name,
-                            object_schema=schema_name,
-                            grantee_type="ROLE",
-                            grantee_name=role,
-                            with_grant_option=row.get("grant_option", "false") == "true",
-                            granted_by=row.get("granted_by"),
-                        )
+        try:
+            cursor.execute(f"SHOW GRANTS TO ROLE {_quoted(role)}")
+            # Iterating the cursor converts rows as result chunks come in,
+            # without first building a list of every row dict
+            for row in cursor:
+                full_name = row.get("name")
+                object_type = row.get("granted_on", "")
+                db_name, schema_name, obj_name = self._parse_object_name(full_name, object_type)
+
+                grants.append(
+                    PlatformGrant(
+                        privilege=row.get("privilege", ""),
+                        object_type=object_type,
+                        object_name=obj_name,
+                        object_database=db_name,
+                        object_schema=schema_name,
+                        grantee_type="ROLE",
+                        grantee_name=role,
+                        with_grant_option=row.get("grant_option", "false") == "true",
+                        granted_by=row.get("granted_by"),
                     )
-            except Exception:
-                pass
-
-        cursor.close()
+                )
+        except Exception:
+            pass
+        finally:
+            cursor.close()
         return grants
 
-    async def sync_databases(self) -> list[PlatformDatabase]:
-        conn = self._get_connection()
-        cursor = conn.cursor(DictCursor)
-        cursor.execute("SHOW DATABASES")
+    def _account_usage_grants(self) -> list[list[PlatformGrant]]:
+        """Read the current grants to roles, grouped into a batch per role."""
+        cursor = self._get_connection().cursor(DictCursor)
+        grants_by_role: dict[str, list[PlatformGrant]] = {}
+        try:
+            cursor.execute(_ACCOUNT_USAGE_GRANTS_SQL)
+            for row in cursor:
+                object_type = row["GRANTED_ON"]
+                name = row["NAME"]
+                db_name = row["TABLE_CATALOG"]
+                schema_name = row["TABLE_SCHEMA"]
+                if object_type == "DATABASE":
+                    db_name = name
+                elif object_type == "SCHEMA":
+                    schema_name = name
+
+                role = row["GRANTEE_NAME"]
+                grants_by_role.setdefault(role, []).append(
+                    PlatformGrant(
+                        privilege=row["PRIVILEGE"],
+                        object_type=object_type,
+                        object_name=name,
+                        object_database=db_name,
+                        object_schema=schema_name,
+                        grantee_type="ROLE",
+                        grantee_name=role,
+                        with_grant_option=bool(row["GRANT_OPTION"]),
+                        granted_by=row["GRANTED_BY"],
+                    )
+                )
+        finally:
+            cursor.close()
+        return list(grants_by_role.values())
 
+    @_in_thread
+    def sync_databases(self) -> list[PlatformDatabase]:
         databases = []
-        for row in cursor.fetchall():
+        for row in self._show("SHOW DATABASES"):
             databases.append(
                 PlatformDatabase(
                     name=row["name"],
@@ -281,39 +471,60 @@ class SnowflakeConnector(PlatformConnector):
                     },
                 )
             )
-        cursor.close()
         return databases
 
     async def sync_schemas(self) -> list[PlatformSchema]:
-        conn = self._get_connection()
-        cursor = conn.cursor(DictCursor)
+        """Fetch the schemas of every database.
 
-        schemas = []
+        One SHOW SCHEMAS IN ACCOUNT covers all databases. If that hits the SHOW
+        row limit, each database is listed on its own, several at a time.
+        """
+        schemas = await asyncio.to_thread(self._account_schemas)
+        if schemas is not None:
+            return schemas
 
-        # Get all databases first
-        cursor.execute("SHOW DATABASES")
-        databases = [row["name"] for row in cursor.fetchall()]
-
-        for db in databases:
-            try:
-                cursor.execute(f"SHOW SCHEMAS IN DATABASE {db}")
-                for row in cursor.fetchall():
-                    schemas.append(
-                        PlatformSchema(
-                            name=row["name"],
-                            database_name=db,
-                            owner=row.get("owner"),
-                            description=row.get("comment"),
-                            created_on=str(row.get("created_on")) if row.get("created_on") else None,
-                        )
-                    )
-            except Exception:
-                # Skip databases we don't have access to
-                pass
+        databases = await asyncio.to_thread(self._database_names)
+        batches = await asyncio.gather(*_start_bounded(self._schemas_in_database, databases))
+        return [schema for batch in batches for schema in batch]
 
-        cursor.close()
+    def _account_schemas(self) -> list[PlatformSchema] | None:
+        """List all schemas with one query, or None if the output was cut off."""
+        cursor = self._get_connection().cursor(DictCursor)
+        try:
+            cursor.execute("SHOW SCHEMAS IN ACCOUNT")
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+        if len(rows) >= _SHOW_MAX_ROWS:
+            return None
+        return [self._schema_from_row(row, row["database_name"]) for row in rows]
+
+    def _database_names(self) -> list[str]:
+        return [row["name"] for row in self._show("SHOW DATABASES")]
+
+    def _schemas_in_database(self, db: str) -> list[PlatformSchema]:
+        cursor = self._get_connection().cursor(DictCursor)
+        schemas = []
+        try:
+            cursor.execute(f"SHOW SCHEMAS IN DATABASE {_quoted(db)}")
+            for row in cursor:
+                schemas.append(self._schema_from_row(row, db))
+        except Exception:
+            # Skip databases we don't have access to
+            pass
+        finally:
+            cursor.close()
         return schemas
 
+    def _schema_from_row(self, row: dict, db: str) -> PlatformSchema:
+        return PlatformSchema(
+            name=row["name"],
+            database_name=db,
+            owner=row.get("owner"),
+            description=row.get("comment"),
+            created_on=str(row.get("created_on")) if row.get("created_on") else None,
+        )
+
     # SQL Generation
 
     def generate_create_role_sql(self, role_name: str, **kwargs) -> str:
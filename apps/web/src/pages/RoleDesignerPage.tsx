@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { useSearchParams, useNavigate } from 'react-router-dom'
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
@@ -150,6 +150,8 @@ export default function RoleDesignerPage() {
   const [loading, setLoading] = useState(true)
   const [dataLoading, setDataLoading] = useState(false)
   const [designerData, setDesignerData] = useState<RoleDesignerData | null>(null)
+  // Access maps are fetched per role, only for roles selected for inheritance
+  const [roleAccessMaps, setRoleAccessMaps] = useState<Record<string, DatabaseAccessDetail[]>>({})
 
   // Role design state
   const [roleType, setRoleType] = useState<'functional' | 'business' | null>(null)
@@ -223,6 +225,7 @@ export default function RoleDesignerPage() {
             token
           )
           setDesignerData(data)
+          setRoleAccessMaps({})
         }
       } catch (error) {
         console.error('Failed to load designer data:', error)
@@ -238,6 +241,64 @@ export default function RoleDesignerPage() {
     loadDesignerData()
   }, [selectedConnectionId, getToken, toast])
 
+  // Roles whose access maps are being fetched, for the connection they were
+  // requested for. Switching connections starts a new set, so responses for
+  // the previous connection are recognised as stale.
+  const accessMapRequests = useRef<{ connectionId: string | null; pending: Set<string> }>({
+    connectionId: null,
+    pending: new Set(),
+  })
+
+  // Load access maps of inherited roles that haven't been fetched yet
+  useEffect(() => {
+    if (accessMapRequests.current.connectionId !== selectedConnectionId) {
+      accessMapRequests.current = { connectionId: selectedConnectionId, pending: new Set() }
+    }
+    const requests = accessMapRequests.current
+    const missingRoles = inheritFromRoles.filter(
+      (role) => !(role in roleAccessMaps) && !requests.pending.has(role)
+    )
+    if (!selectedConnectionId || missingRoles.length === 0) {
+      return
+    }
+
+    missingRoles.forEach((role) => requests.pending.add(role))
+    const isStale = () => accessMapRequests.current !== requests
+
+    const loadAccessMaps = async () => {
+      try {
+        const token = await getToken()
+        if (token) {
+          const accessMaps = await Promise.all(
+            missingRoles.map((role) =>
+              api.get<DatabaseAccessDetail[]>(
+                `/objects/roles/${encodeURIComponent(role)}/access-map?connection_id=${selectedConnectionId}`,
+                token
+              )
+            )
+          )
+          if (isStale()) {
+            return
+          }
+          setRoleAccessMaps((prev) => {
+            const next = { ...prev }
+            missingRoles.forEach((role, i) => {
+              next[role] = accessMaps[i] ?? []
+            })
+            return next
+          })
+        }
+      } catch (error) {
+        if (!isStale()) {
+          console.error('Failed to load role access maps:', error)
+        }
+      } finally {
+        missingRoles.forEach((role) => requests.pending.delete(role))
+      }
+    }
+    loadAccessMaps()
+  }, [inheritFromRoles, roleAccessMaps, selectedConnectionId, getToken])
+
   // Load role data when in edit mode
   useEffect(() => {
     const loadRoleData = async () => {
@@ -1059,8 +1120,9 @@ export default function RoleDesignerPage() {
                         totalGrants += summary.privilege_count
 
                         // Merge access_map data
-                        if (summary.access_map) {
-                          for (const dbAccess of summary.access_map) {
+                        const accessMap = roleAccessMaps[role]
+                        if (accessMap) {
+                          for (const dbAccess of accessMap) {
                             let dbEntry = mergedAccessMap[dbAccess.name]
                             if (!dbEntry) {
                               dbEntry = { privileges: new Set(), schemas: {} }
@@ -0,0 +1,21 @@
+-- =============================================================================
+-- GRANTD DATABASE SCHEMA - Grant Lookup Indexes
+-- =============================================================================
+-- Version: 008
+-- Description: Composite indexes for the per-connection grant and role
+--              assignment lookups used by the objects API
+-- =============================================================================
+
+-- Grants to a specific role (role details, role designer, user access)
+CREATE INDEX IF NOT EXISTS idx_platform_grants_conn_grantee
+    ON platform_grants(connection_id, grantee_type, grantee_name);
+
+-- Imported/shared database detection
+CREATE INDEX IF NOT EXISTS idx_platform_grants_conn_imported
+    ON platform_grants(connection_id, object_database)
+    WHERE privilege = 'IMPORTED PRIVILEGES';
+
+-- Assignments of a specific role (role privileges editor, the user access role
+-- walk) are served by UNIQUE(connection_id, role_name, assignee_type,
+-- assignee_name), which already carries the assignee names, so they need no
+-- separate index.
@@ -0,0 +1,24 @@
+-- =============================================================================
+-- GRANTD DATABASE SCHEMA - Assignee and Pending Changeset Indexes
+-- =============================================================================
+-- Version: 009
+-- Description: Composite indexes for role assignee lookups, grants by object
+--              and the pending changeset count on the dashboard
+-- =============================================================================
+
+-- Assignments to a specific user or role, returning the granted roles (user
+-- access, role privileges editor, role inheritance graph). role_name is
+-- included so the lookup is answered from the index alone.
+CREATE INDEX IF NOT EXISTS idx_role_assignments_conn_assignee
+    ON role_assignments(connection_id, assignee_type, assignee_name)
+    INCLUDE (role_name);
+
+-- Grants on a specific object (warehouse designer). Also serves lookups by
+-- object type alone (warehouse listings, object type filters).
+CREATE INDEX IF NOT EXISTS idx_platform_grants_conn_object
+    ON platform_grants(connection_id, object_type, object_name);
+
+-- Pending changesets per org (dashboard stats)
+CREATE INDEX IF NOT EXISTS idx_changesets_org_pending
+    ON changesets(org_id)
+    WHERE status IN ('draft', 'pending_review');
@@ -0,0 +1,19 @@
+-- =============================================================================
+-- GRANTD DATABASE SCHEMA - Trigram Search Indexes
+-- =============================================================================
+-- Version: 010
+-- Description: pg_trgm GIN indexes so the substring (ILIKE '%term%') searches
+--              on users and roles can use an index instead of a full scan
+-- =============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- User search by name or email
+CREATE INDEX IF NOT EXISTS idx_platform_users_name_trgm
+    ON platform_users USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_platform_users_email_trgm
+    ON platform_users USING gin (email gin_trgm_ops);
+
+-- Role search by name
+CREATE INDEX IF NOT EXISTS idx_platform_roles_name_trgm
+    ON platform_roles USING gin (name gin_trgm_ops);
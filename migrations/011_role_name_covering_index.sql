@@ -0,0 +1,13 @@
+-- =============================================================================
+-- GRANTD DATABASE SCHEMA - Role Name Covering Index
+-- =============================================================================
+-- Version: 011
+-- Description: Covering index for the role name and system flag lookups, so
+--              they can be answered from the index alone
+-- =============================================================================
+
+-- Role names and system flags per connection (user access, role listing with
+-- include_system=false). Users and roles by (connection_id, name) are already
+-- served by their UNIQUE(connection_id, name) constraints.
+CREATE INDEX IF NOT EXISTS idx_platform_roles_conn_name_system
+    ON platform_roles(connection_id, name) INCLUDE (is_system);
@@ -80,22 +80,26 @@ def apply(
 
         from grantd_cli.utils.platforms.snowflake import execute_statements
 
+        total = len(sql_statements)
+        results = execute_statements(
+            account=account,
+            user=user,
+            auth_method=auth_method,
+            role=role,
+            statements=sql_statements,
+        )
+
         success_count = 0
-        for idx, sql in enumerate(sql_statements, 1):
-            try:
-                with console.status(f"[{idx}/{len(sql_statements)}] Executing..."):
-                    execute_statements(
-                        account=account,
-                        user=user,
-                        auth_method=auth_method,
-                        role=role,
-                        statements=[sql],
-                    )
-                console.print(f"  [{idx}/{len(sql_statements)}] {sql[:40]}... [green]OK[/green]")
-                success_count += 1
-            except Exception as e:
-                console.print(f"  [{idx}/{len(sql_statements)}] {sql[:40]}... [red]FAILED[/red]")
-                console.print(f"    Error: {e}")
+        with console.status(f"[1/{total}] Executing...") as progress:
+            for idx, (sql, error) in enumerate(results, 1):
+                if error is None:
+                    console.print(f"  [{idx}/{total}] {sql[:40]}... [green]OK[/green]")
+                    success_count += 1
+                else:
+                    console.print(f"  [{idx}/{total}] {sql[:40]}... [red]FAILED[/red]")
+                    console.print(f"    Error: {error}")
+                if idx < total:
+                    progress.update(f"[{idx + 1}/{total}] Executing...")
 
         # Mark as applied
         if success_count == len(sql_statements):
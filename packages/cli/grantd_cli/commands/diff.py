@@ -7,6 +7,14 @@ from grantd_cli.utils.auth import require_auth
 
 console = Console()
 
+# Row prefix by the verb a change type starts with (create_role, grant, ...)
+_CHANGE_PREFIXES = {
+    "create": "[green]+[/green]",
+    "grant": "[green]+[/green]",
+    "drop": "[red]-[/red]",
+    "revoke": "[red]-[/red]",
+}
+
 
 @require_auth
 def diff(
@@ -42,28 +50,24 @@ def diff(
 
             console.print()
 
-            # Get changeset details with changes
-            details = api.get(f"/changesets/{changeset['id']}")
+            # The list includes each changeset's changes, in execution order
+            changes = changeset.get("changes", [])
 
-            if details.get("changes"):
+            if changes:
                 table = Table(show_header=True, header_style="bold")
                 table.add_column("#", style="dim")
                 table.add_column("Type")
                 table.add_column("Object")
                 table.add_column("SQL")
 
-                for idx, change in enumerate(details["changes"], 1):
+                for idx, change in enumerate(changes, 1):
                     sql = change["sql_statement"]
                     if len(sql) > 50:
                         sql = sql[:47] + "..."
 
                     # Color based on type
-                    if "CREATE" in change["change_type"].upper() or "GRANT" in change["change_type"].upper():
-                        prefix = "[green]+[/green]"
-                    elif "DROP" in change["change_type"].upper() or "REVOKE" in change["change_type"].upper():
-                        prefix = "[red]-[/red]"
-                    else:
-                        prefix = "[yellow]~[/yellow]"
+                    verb = change["change_type"].split("_", 1)[0].lower()
+                    prefix = _CHANGE_PREFIXES.get(verb, "[yellow]~[/yellow]")
 
                     table.add_row(
                         str(idx),
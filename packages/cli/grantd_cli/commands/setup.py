@@ -29,26 +29,34 @@ def setup(
         console.print(f"[yellow]{platform.title()} support coming soon![/yellow]")
         raise typer.Exit(1)
 
-    # Gather information
-    account = Prompt.ask("Account identifier", default="your-account.region")
-    service_account = Prompt.ask("Service account name", default="GRANTD_READONLY")
-    databases = Prompt.ask(
-        "Databases to include (comma-separated)",
-        default="*",
-    )
+    from concurrent.futures import ThreadPoolExecutor
 
-    # Generate RSA key pair
-    console.print("\nGenerating RSA key pair...")
     from grantd_cli.utils.crypto import generate_key_pair
 
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # The key pair doesn't depend on the answers below, so generate it
+        # while the user is typing them
+        key_pair = executor.submit(generate_key_pair)
+
+        # Gather information
+        account = Prompt.ask("Account identifier", default="your-account.region")
+        service_account = Prompt.ask("Service account name", default="GRANTD_READONLY")
+        databases = Prompt.ask(
+            "Databases to include (comma-separated)",
+            default="*",
+        )
+
+        # Generate RSA key pair
+        console.print("\nGenerating RSA key pair...")
+        private_key, public_key = key_pair.result()
+
     from grantd_cli.config import settings
 
+    settings.ensure_dirs()
     key_name = account.replace(".", "-").lower()
     private_key_path = settings.keys_dir / f"{key_name}.pem"
     public_key_path = settings.keys_dir / f"{key_name}.pub"
 
-    private_key, public_key = generate_key_pair()
-
     private_key_path.write_text(private_key)
     private_key_path.chmod(0o600)
     public_key_path.write_text(public_key)
@@ -59,19 +67,24 @@ def setup(
     # Generate setup SQL
     setup_sql = _generate_snowflake_setup_sql(
         service_account=service_account,
-        public_key=public_key.replace("-----BEGIN PUBLIC KEY-----", "")
-        .replace("-----END PUBLIC KEY-----", "")
-        .replace("\n", ""),
+        # Base64 body of the PEM, without the BEGIN/END lines
+        public_key="".join(
+            line for line in public_key.splitlines() if not line.startswith("-----")
+        ),
         databases=databases,
     )
 
     output.write_text(setup_sql)
-    console.print(f"\n[green]Setup SQL saved to: {output}[/green]")
-
-    console.print("\n[bold]Next steps:[/bold]")
-    console.print(f"  1. Run {output} in Snowflake as ACCOUNTADMIN")
     console.print(
-        f"  2. Run: grantd connect --platform snowflake --account {account}"
+        "\n".join(
+            [
+                f"\n[green]Setup SQL saved to: {output}[/green]",
+                "",
+                "[bold]Next steps:[/bold]",
+                f"  1. Run {output} in Snowflake as ACCOUNTADMIN",
+                f"  2. Run: grantd connect --platform snowflake --account {account}",
+            ]
+        )
     )
 
 
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import typer
 from rich.console import Console
 from rich.table import Table
@@ -33,8 +35,6 @@ def status():
         for conn in connections:
             last_sync = conn.get("last_sync_at", "Never")
             if last_sync and last_sync != "Never":
-                from datetime import datetime
-
                 dt = datetime.fromisoformat(last_sync.replace("Z", "+00:00"))
                 last_sync = dt.strftime("%Y-%m-%d %H:%M")
 
@@ -37,16 +37,19 @@ def sync(
             sync_id = result["id"]
             progress.update(task, description="Sync in progress...")
 
-            # Poll for completion
+            # Poll for completion, backing off from quick checks (most syncs
+            # are short) to one every few seconds for long ones
             import time
 
+            delay = 0.25
             while True:
                 status = api.get(f"/sync/status/{connection}")
                 if status and len(status) > 0:
                     latest = status[0]
                     if latest["status"] in ["completed", "failed"]:
                         break
-                time.sleep(2)
+                time.sleep(delay)
+                delay = min(delay * 1.6, 4.0)
 
             progress.update(task, description="Sync completed!")
 
@@ -18,9 +18,12 @@ class Settings(BaseSettings):
     config_dir: Path = Path.home() / ".grantd"
     keys_dir: Path = Path.home() / ".grantd" / "keys"
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Ensure directories exist
+    def ensure_dirs(self) -> None:
+        """Create the local config and key directories if they don't exist.
+
+        Called by the commands that write there, so loading the settings
+        doesn't touch the filesystem.
+        """
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.keys_dir.mkdir(parents=True, exist_ok=True)
 
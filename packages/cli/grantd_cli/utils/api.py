@@ -1,76 +1,76 @@
 from typing import Any
 
-import httpx
-
-from grantd_cli.config import settings
 from grantd_cli.utils.auth import get_access_token
 
 
 class ApiClient:
-    """HTTP client for Grantd API."""
+    """HTTP client for Grantd API.
+
+    Requests share one httpx client, so they reuse its connections instead of
+    opening a new one (and TLS session) per call, e.g. when polling sync status.
+    """
 
     def __init__(self, base_url: str, token: str | None = None):
         self.base_url = base_url
         self.token = token
 
+        # Imported here, like the config, so that starting the CLI (e.g. for
+        # --help or --version) doesn't pay for it
+        import httpx
+
+        self._client = httpx.Client(
+            base_url=base_url,
+            headers=self._headers(),
+            timeout=30.0,
+        )
+
     def _headers(self) -> dict[str, str]:
         headers = {"Content-Type": "application/json"}
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
         return headers
 
+    def close(self) -> None:
+        """Close the underlying connections."""
+        self._client.close()
+
+    def __enter__(self) -> "ApiClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def get(self, endpoint: str, params: dict | None = None) -> Any:
         """GET request."""
-        with httpx.Client() as client:
-            response = client.get(
-                f"{self.base_url}{endpoint}",
-                params=params,
-                headers=self._headers(),
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = self._client.get(endpoint, params=params)
+        response.raise_for_status()
+        return response.json()
 
     def post(self, endpoint: str, json: dict | None = None) -> Any:
         """POST request."""
-        with httpx.Client() as client:
-            response = client.post(
-                f"{self.base_url}{endpoint}",
-                json=json,
-                headers=self._headers(),
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = self._client.post(endpoint, json=json)
+        response.raise_for_status()
+        return response.json()
 
     def patch(self, endpoint: str, json: dict | None = None) -> Any:
         """PATCH request."""
-        with httpx.Client() as client:
-            response = client.patch(
-                f"{self.base_url}{endpoint}",
-                json=json,
-                headers=self._headers(),
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = self._client.patch(endpoint, json=json)
+        response.raise_for_status()
+        return response.json()
 
     def delete(self, endpoint: str) -> Any:
         """DELETE request."""
-        with httpx.Client() as client:
-            response = client.delete(
-                f"{self.base_url}{endpoint}",
-                headers=self._headers(),
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            if response.status_code == 204:
-                return None
-            return response.json()
+        response = self._client.delete(endpoint)
+        response.raise_for_status()
+        if response.status_code == 204:
+            return None
+        return response.json()
 
 
 def get_api_client() -> ApiClient:
     """Get an authenticated API client."""
+    from grantd_cli.config import settings
+
     token = get_access_token()
     return ApiClient(settings.api_url, token)
 
@@ -79,6 +79,8 @@ def authenticate(email: str, password: str) -> dict[str, str]:
     """Authenticate with Cognito and return tokens."""
     # In production, this would call Cognito directly
     # For now, we'll use a simple API endpoint
+    from grantd_cli.config import settings
+
     client = ApiClient(settings.api_url)
 
     # This is a placeholder - actual implementation would use
@@ -1,7 +1,6 @@
 import functools
 from typing import Callable
 
-import keyring
 import typer
 from rich.console import Console
 
@@ -14,22 +13,36 @@ console = Console()
 
 def store_credentials(access_token: str, refresh_token: str):
     """Store tokens in system keyring."""
+    import keyring
+
     keyring.set_password(SERVICE_NAME, ACCESS_TOKEN_KEY, access_token)
     keyring.set_password(SERVICE_NAME, REFRESH_TOKEN_KEY, refresh_token)
+    get_access_token.cache_clear()
 
 
+@functools.lru_cache(maxsize=1)
 def get_access_token() -> str | None:
-    """Get access token from keyring."""
+    """Get access token from keyring.
+
+    Read once per process: the auth check and the API client both need it, and
+    each keyring read can be a round trip to the system credential store.
+    """
+    import keyring
+
     return keyring.get_password(SERVICE_NAME, ACCESS_TOKEN_KEY)
 
 
 def get_refresh_token() -> str | None:
     """Get refresh token from keyring."""
+    import keyring
+
     return keyring.get_password(SERVICE_NAME, REFRESH_TOKEN_KEY)
 
 
 def clear_credentials():
     """Clear stored credentials."""
+    import keyring
+
     try:
         keyring.delete_password(SERVICE_NAME, ACCESS_TOKEN_KEY)
     except keyring.errors.PasswordDeleteError:
@@ -38,6 +51,7 @@ def clear_credentials():
         keyring.delete_password(SERVICE_NAME, REFRESH_TOKEN_KEY)
     except keyring.errors.PasswordDeleteError:
         pass
+    get_access_token.cache_clear()
 
 
 def require_auth(func: Callable) -> Callable:
@@ -1,5 +1,5 @@
 import webbrowser
-from typing import Literal
+from typing import Iterator, Literal
 
 import snowflake.connector
 
@@ -13,8 +13,12 @@ def execute_statements(
     password: str | None = None,
     private_key_path: str | None = None,
     warehouse: str | None = None,
-):
-    """Execute SQL statements against Snowflake.
+) -> Iterator[tuple[str, Exception | None]]:
+    """Execute SQL statements against Snowflake in one session.
+
+    Connects once, then runs the statements in order. Yields each statement
+    with None if it succeeded, or with the error it raised; a failed statement
+    doesn't stop the ones after it. Nothing happens until iteration starts.
 
     Args:
         account: Snowflake account identifier
@@ -60,8 +64,15 @@ def execute_statements(
 
     try:
         cursor = conn.cursor()
-        for statement in statements:
-            cursor.execute(statement)
-        cursor.close()
+        try:
+            for statement in statements:
+                try:
+                    cursor.execute(statement)
+                except snowflake.connector.Error as e:
+                    yield statement, e
+                else:
+                    yield statement, None
+        finally:
+            cursor.close()
     finally:
         conn.close()
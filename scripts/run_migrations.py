@@ -53,7 +53,8 @@ def run_migrations():
         return
 
     conn = get_connection()
-    # Use autocommit mode so each statement is committed independently
+    # Use autocommit mode so each file (or, on fallback, each statement) is
+    # committed independently
     conn.autocommit = True
     cursor = conn.cursor()
 
@@ -66,6 +67,17 @@ def run_migrations():
 
         sql = migration_file.read_text()
 
+        # Send the whole file in one round trip. PostgreSQL runs a
+        # multi-statement query as one implicit transaction, so if anything
+        # fails (typically "already exists" on a re-run) nothing is applied
+        # and we fall back to running it statement by statement below.
+        try:
+            cursor.execute(sql)
+            print(f"  OK")
+            continue
+        except psycopg2.Error:
+            pass
+
         # Split by statements for better error handling
         # (Simple split - doesn't handle all edge cases)
         statements = [s.strip() for s in sql.split(";") if s.strip()]